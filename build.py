@@ -1,11 +1,32 @@
 #!/usr/bin/env python3
 
 import os
+import sys
+import argparse
 import platform
 import subprocess
 import shutil
+import tempfile
+import threading
+import time
+import errno
+import stat
+import ctypes
+import ctypes.util
+import hashlib
+import importlib.util
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:
+    # Not available on Windows
+    fcntl = None
+
+# Keep Windows from allocating a console (and conhost.exe) for every child process
+_POPEN_KW = {'creationflags': subprocess.CREATE_NO_WINDOW} if platform.system() == 'Windows' else {}
+
 def clear_screen():
     os.system('cls' if platform.system() == 'Windows' else 'clear')
 
@@ -18,199 +39,531 @@ def print_banner():
     """
     print(banner)
 
-def build_windows():
-    print("\n[*] Building Windows executable...")
+def _async_clean(path):
+    """Move a stale build directory aside and delete it in the background"""
+    if not os.path.exists(path):
+        return
+    
+    # Renaming is a single metadata operation, so the path is free immediately
+    stale = f"{path}.old-{os.getpid()}-{time.time_ns()}"
+    os.rename(path, stale)
+    
+    if platform.system() == 'Windows':
+        # Native rmdir is much faster than unlinking file by file from Python
+        subprocess.Popen(["cmd", "/c", "rmdir", "/s", "/q", stale], **_POPEN_KW)
+    else:
+        threading.Thread(
+            target=shutil.rmtree,
+            args=(stale,),
+            kwargs={'ignore_errors': True}
+        ).start()
+
+# ioctl request number for FICLONE on Linux
+FICLONE = 0x40049409
+
+COPY_CHUNK_SIZE = 1 << 20
+SMALL_FILE_SIZE = 16 * 1024
+
+def _copy_file_data(src_fd, dst_fd, size):
+    """Copy file contents using the cheapest mechanism the kernel offers"""
+    remaining = size
+    
+    # copy_file_range has a fixed per-call overhead, so tiny files skip it
+    if size >= SMALL_FILE_SIZE:
+        try:
+            if hasattr(os, 'copy_file_range'):
+                while remaining:
+                    copied = os.copy_file_range(src_fd, dst_fd, remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining and hasattr(os, 'sendfile') and platform.system() == 'Linux':
+                offset = size - remaining
+                while remaining:
+                    sent = os.sendfile(dst_fd, src_fd, offset, min(remaining, COPY_CHUNK_SIZE))
+                    if sent == 0:
+                        break
+                    offset += sent
+                    remaining -= sent
+        except OSError as e:
+            if e.errno not in (errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP):
+                raise
+    
+    if remaining:
+        # Plain large-buffer read/write for small files and unsupported filesystems
+        os.lseek(src_fd, size - remaining, os.SEEK_SET)
+        os.lseek(dst_fd, size - remaining, os.SEEK_SET)
+        buffer = bytearray(min(COPY_CHUNK_SIZE, max(remaining, 1)))
+        view = memoryview(buffer)
+        with open(src_fd, 'rb', buffering=0, closefd=False) as reader:
+            while True:
+                n = reader.readinto(buffer)
+                if not n:
+                    break
+                os.write(dst_fd, view[:n])
+
+def _reflink(src_fd, dst_fd):
+    """Share src's extents with dst on CoW filesystems (btrfs, XFS); False if unsupported"""
+    if fcntl is None or platform.system() != 'Linux':
+        return False
     try:
-        # Create dist and build directories if they don't exist
-        os.makedirs('dist', exist_ok=True)
-        os.makedirs('build', exist_ok=True)
-        
-        # Clean previous builds
-        print("[+] Cleaning previous builds...")
-        if os.path.exists('dist/IPSWCompare'):
-            shutil.rmtree('dist/IPSWCompare')
-        
-        print("[+] Starting PyInstaller build...")
-        command = [
-            "pyinstaller",
-            "--name", "IPSWCompare",
-            "--windowed",
-            "--icon", "app_icon.icns",
-            "--add-data", "app_icon.icns;.",
-            "--add-data", "forest-dark.tcl;.",
-            "--add-data", "forest-dark;forest-dark",
-            "--hidden-import", "PIL",
-            "--hidden-import", "PIL._tkinter_finder",
-            "--hidden-import", "requests",
-            "ipsw_firmware_tool.py"
-        ]
-        
-        result = subprocess.run(command, capture_output=True, text=True)
-        
-        if result.returncode != 0:
-            print("[!] PyInstaller Error Output:")
-            print(result.stderr)
-            raise subprocess.CalledProcessError(result.returncode, command)
-            
-        print("\n[✓] Windows build completed successfully!")
-        print(f"[i] Executable location: {os.path.abspath('dist/IPSWCompare/IPSWCompare.exe')}")
-        
-    except subprocess.CalledProcessError as e:
-        print(f"\n[!] Error during Windows build: {str(e)}")
-        raise
-    except Exception as e:
-        print(f"\n[!] Unexpected error during Windows build: {str(e)}")
-        raise
+        fcntl.ioctl(dst_fd, FICLONE, src_fd)
+        return True
+    except OSError:
+        return False
+
+def fast_copytree(src, dst, hardlink=False):
+    """Recursively copy src into dst without spawning cp
+    
+    Each file is reflinked where the filesystem allows it, then hardlinked
+    if hardlink is set, and only otherwise has its bytes copied.
+    """
+    os.makedirs(dst, exist_ok=True)
+    with os.scandir(src) as entries:
+        for entry in entries:
+            target = os.path.join(dst, entry.name)
+            if entry.is_symlink():
+                if os.path.lexists(target):
+                    os.remove(target)
+                os.symlink(os.readlink(entry.path), target)
+            elif entry.is_dir():
+                fast_copytree(entry.path, target, hardlink)
+            else:
+                if hardlink:
+                    try:
+                        if os.path.lexists(target):
+                            os.remove(target)
+                        os.link(entry.path, target)
+                        continue
+                    except OSError:
+                        pass
+                
+                st = entry.stat()
+                src_fd = os.open(entry.path, os.O_RDONLY)
+                try:
+                    dst_fd = os.open(target, os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+                                     stat.S_IMODE(st.st_mode))
+                    try:
+                        if not _reflink(src_fd, dst_fd):
+                            _copy_file_data(src_fd, dst_fd, st.st_size)
+                    finally:
+                        os.close(dst_fd)
+                finally:
+                    os.close(src_fd)
+                os.chmod(target, stat.S_IMODE(st.st_mode))
 
-def build_linux():
-    print("\n[*] Building Linux AppImage...")
+def _load_clonefile():
+    """Resolve macOS clonefile(2), or None on other platforms"""
+    if platform.system() != 'Darwin':
+        return None
     try:
-        # Create dist and build directories if they don't exist
-        os.makedirs('dist', exist_ok=True)
-        os.makedirs('build', exist_ok=True)
-        
-        # Clean previous builds
-        print("[+] Cleaning previous builds...")
-        if os.path.exists('dist/IPSWCompare'):
-            shutil.rmtree('dist/IPSWCompare')
-        if os.path.exists('IPSWCompare.AppDir'):
-            shutil.rmtree('IPSWCompare.AppDir')
-        
-        print("[+] Starting PyInstaller build...")
-        command = [
-            "pyinstaller",
-            "--name", "IPSWCompare",
-            "--windowed",
-            "--icon", "app_icon.icns",
-            "--add-data", "app_icon.icns:.",
-            "--add-data", "forest-dark.tcl:.",
-            "--add-data", "forest-dark:forest-dark",
-            "--hidden-import", "PIL",
-            "--hidden-import", "PIL._tkinter_finder",
-            "--hidden-import", "requests",
-            "ipsw_firmware_tool.py"
-        ]
-        
-        result = subprocess.run(command, capture_output=True, text=True)
-        
-        if result.returncode != 0:
-            print("[!] PyInstaller Error Output:")
-            print(result.stderr)
-            raise subprocess.CalledProcessError(result.returncode, command)
-        
-        print("[+] Creating AppDir structure...")
-        os.makedirs("IPSWCompare.AppDir/usr/bin", exist_ok=True)
-        os.makedirs("IPSWCompare.AppDir/usr/share/applications", exist_ok=True)
-        os.makedirs("IPSWCompare.AppDir/usr/share/icons/hicolor/256x256/apps", exist_ok=True)
-        
-        print("[+] Creating desktop entry...")
-        with open("IPSWCompare.AppDir/usr/share/applications/IPSWCompare.desktop", "w") as f:
-            f.write("""[Desktop Entry]
+        system = ctypes.CDLL(ctypes.util.find_library('System'), use_errno=True)
+        clonefile = system.clonefile
+    except (OSError, AttributeError):
+        return None
+    clonefile.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int]
+    clonefile.restype = ctypes.c_int
+    return clonefile
+
+_clonefile = _load_clonefile()
+
+def clone_tree(src, dst):
+    """Copy-on-write clone of src to dst (APFS), falling back to a regular copy"""
+    if _clonefile is not None:
+        if _clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0:
+            return
+        err = ctypes.get_errno()
+        # Non-APFS volumes and cross-device targets can't clone; copy instead
+        if err not in (errno.ENOTSUP, errno.EXDEV):
+            raise OSError(err, os.strerror(err), src, None, dst)
+    fast_copytree(src, dst)
+
+SPEC_FILE = 'IPSWCompare.spec'
+
+DATA_FILES = [
+    ('app_icon.icns', '.'),
+    ('forest-dark.tcl', '.'),
+    ('forest-dark', 'forest-dark')
+]
+
+HIDDEN_IMPORTS = ['PIL', 'PIL._tkinter_finder', 'requests']
+
+BUILD_INPUTS = ['ipsw_firmware_tool.py', 'app_icon.icns', 'forest-dark.tcl', 'forest-dark', SPEC_FILE]
+
+SPEC_TEMPLATE = """# -*- mode: python ; coding: utf-8 -*-
+# Generated by build.py - edit build.py instead of this file
+import sys
+
+a = Analysis(
+    ['ipsw_firmware_tool.py'],
+    datas={datas!r},
+    hiddenimports={hiddenimports!r},
+)
+pyz = PYZ(a.pure)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name='IPSWCompare',
+    console=False,
+    upx=False,
+    icon='app_icon.icns',
+)
+coll = COLLECT(exe, a.binaries, a.datas, upx=False, name='IPSWCompare')
+
+if sys.platform == 'darwin':
+    app = BUNDLE(coll, name='IPSWCompare.app', icon='app_icon.icns')
+"""
+
+def _newest_mtime(paths):
+    """Most recent modification time across files and directory trees"""
+    newest = 0
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                for name in files:
+                    newest = max(newest, os.stat(os.path.join(root, name)).st_mtime)
+        elif os.path.exists(path):
+            newest = max(newest, os.stat(path).st_mtime)
+    return newest
+
+def _is_up_to_date(output, inputs):
+    """True when output exists and is newer than every input"""
+    return os.path.exists(output) and os.stat(output).st_mtime >= _newest_mtime(inputs)
+
+def _inputs_digest(target, paths):
+    """BLAKE2b digest over the target name and every build input, in a stable order"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(target.encode())
+    for path in sorted(paths):
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files):
+                    file_path = os.path.join(root, name)
+                    digest.update(os.path.relpath(file_path, path).encode())
+                    with open(file_path, 'rb') as f:
+                        digest.update(f.read())
+        elif os.path.isfile(path):
+            digest.update(path.encode())
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+def write_spec():
+    """Emit the shared PyInstaller spec file when build.py has changed"""
+    if _is_up_to_date(SPEC_FILE, [__file__]):
+        return
+    print(f"[+] Writing {SPEC_FILE}...")
+    with open(SPEC_FILE, 'w') as f:
+        f.write(SPEC_TEMPLATE.format(datas=DATA_FILES, hiddenimports=HIDDEN_IMPORTS))
+
+def spawn_tool(argv):
+    """Run a helper tool with stdin/stdout on /dev/null and raise if it fails
+    
+    Uses os.posix_spawnp where available: subprocess only takes its
+    posix_spawn fast path with close_fds=False, so it would otherwise fork
+    the whole build process first.
+    """
+    if not hasattr(os, 'posix_spawnp'):
+        subprocess.run(argv, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, check=True, **_POPEN_KW)
+        return
+    
+    devnull = os.open(os.devnull, os.O_RDWR)
+    try:
+        pid = os.posix_spawnp(argv[0], argv, os.environ, file_actions=[
+            (os.POSIX_SPAWN_DUP2, devnull, 0),
+            (os.POSIX_SPAWN_DUP2, devnull, 1)
+        ])
+    finally:
+        os.close(devnull)
+    
+    _, status = os.waitpid(pid, 0)
+    returncode = os.WEXITSTATUS(status) if os.WIFEXITED(status) else -os.WTERMSIG(status)
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, argv)
+
+APPIMAGETOOL_URL = "https://github.com/AppImage/AppImageKit/releases/download/continuous/appimagetool-x86_64.AppImage"
+BUILD_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'ipsw-build')
+
+def fetch_appimagetool():
+    """Download appimagetool into the build cache unless it is already there"""
+    url_key = hashlib.sha256(APPIMAGETOOL_URL.encode()).hexdigest()[:16]
+    tool_path = os.path.join(BUILD_CACHE_DIR, url_key, os.path.basename(APPIMAGETOOL_URL))
+    if os.path.exists(tool_path):
+        return tool_path
+    
+    os.makedirs(os.path.dirname(tool_path), exist_ok=True)
+    partial_path = f"{tool_path}.part-{os.getpid()}"
+    spawn_tool(["wget", "-qO", partial_path, APPIMAGETOOL_URL])
+    os.chmod(partial_path, 0o755)
+    os.replace(partial_path, tool_path)
+    return tool_path
+
+# Echo PyInstaller output live; parallel workers only write their log files
+_stream_output = True
+
+def _disable_streaming():
+    """Process pool initializer so parallel builds don't interleave output"""
+    global _stream_output
+    _stream_output = False
+
+def run_pyinstaller(target, command):
+    """Run PyInstaller for a target with its own config dir and log file"""
+    # One config/cache dir per target keeps parallel builds from clobbering
+    # each other, and it persists so later runs reuse PyInstaller's bincache
+    env = dict(os.environ)
+    env['PYINSTALLER_CONFIG_DIR'] = os.path.join(BUILD_CACHE_DIR, 'pyinstaller', target)
+    
+    # Stream line by line instead of buffering the whole log in memory
+    log_path = os.path.join('build', f'pyinstaller-{target}.log')
+    with open(log_path, 'w', buffering=1) as log:
+        proc = subprocess.Popen(
+            command,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=1,
+            text=True,
+            env=env,
+            **_POPEN_KW
+        )
+        for line in proc.stdout:
+            log.write(line)
+            if _stream_output:
+                sys.stdout.write(line)
+        returncode = proc.wait()
+    
+    if returncode != 0:
+        print(f"[!] PyInstaller failed ({target})")
+        if not _stream_output:
+            with open(log_path) as log:
+                print(log.read())
+        raise subprocess.CalledProcessError(returncode, command)
+    
+    print(f"[i] PyInstaller log ({target}): {os.path.abspath(log_path)}")
+
+def pyinstaller_build(target, output):
+    """Produce output with PyInstaller, reusing earlier results when inputs match"""
+    # Builds are cached by content, so reverting a change is also a cache hit.
+    # Whatever is already in dist/ is never trusted: it may be partial or compressed
+    cached_output = os.path.join(
+        BUILD_CACHE_DIR, target, _inputs_digest(target, BUILD_INPUTS), os.path.basename(output)
+    )
+    
+    # Clean previous builds
+    print("[+] Cleaning previous builds...")
+    _async_clean(output)
+    
+    if os.path.isdir(cached_output):
+        print(f"[i] Restoring cached build from {cached_output}")
+        clone_tree(cached_output, output)
+        return
+    
+    # The work path is kept between runs so PyInstaller can reuse its analysis
+    print("[+] Starting PyInstaller build...")
+    command = [
+        "pyinstaller",
+        "--noconfirm",
+        "--distpath", os.path.dirname(output),
+        "--workpath", os.path.join("build", target),
+        SPEC_FILE
+    ]
+    run_pyinstaller(target, command)
+    
+    # PyInstaller only bundles a .app on macOS, so other hosts have nothing to cache
+    if not os.path.exists(output):
+        print(f"[!] {output} was not produced, skipping build cache")
+        return
+    
+    # Snapshot into a temporary name first so a partial copy is never reused
+    print("[+] Caching build output...")
+    os.makedirs(os.path.dirname(cached_output), exist_ok=True)
+    partial_output = f"{cached_output}.part-{os.getpid()}"
+    try:
+        clone_tree(output, partial_output)
+        os.replace(partial_output, cached_output)
+    except BaseException:
+        shutil.rmtree(partial_output, ignore_errors=True)
+        raise
+
+def start_upx(binary):
+    """Compress a binary with UPX in the background; returns the process or None"""
+    if not shutil.which('upx'):
+        print("[!] UPX not found, skipping compression")
+        return None
+    print(f"[+] Compressing {binary} with UPX in the background...")
+    return subprocess.Popen(
+        ["upx", "--best", "--lzma", "-q", binary],
+        stdout=subprocess.DEVNULL,
+        **_POPEN_KW
+    )
+
+def wait_upx(proc):
+    """Wait for a background UPX run started by start_upx"""
+    if proc is not None and proc.wait() != 0:
+        raise subprocess.CalledProcessError(proc.returncode, proc.args)
+
+def _prep_appdir_metadata():
+    """Write the AppDir skeleton, desktop entry and PNG icon"""
+    os.makedirs("IPSWCompare.AppDir/usr/bin", exist_ok=True)
+    os.makedirs("IPSWCompare.AppDir/usr/share/applications", exist_ok=True)
+    os.makedirs("IPSWCompare.AppDir/usr/share/icons/hicolor/256x256/apps", exist_ok=True)
+    
+    with open("IPSWCompare.AppDir/usr/share/applications/IPSWCompare.desktop", "w") as f:
+        f.write("""[Desktop Entry]
 Name=IPSW Firmware Comparison Tool
 Exec=IPSWCompare
 Icon=ipswcompare
 Type=Application
 Categories=Development;
 """)
-        
-        print("[+] Copying application files...")
-        subprocess.run(["cp", "-r", "dist/IPSWCompare/*", "IPSWCompare.AppDir/usr/bin/"], shell=True)
-        subprocess.run(["cp", "app_icon.icns", "IPSWCompare.AppDir/usr/share/icons/hicolor/256x256/apps/ipswcompare.png"], shell=True)
-        
-        print("[+] Downloading AppImage tools...")
-        subprocess.run(["wget", "-q", "https://github.com/AppImage/AppImageKit/releases/download/continuous/appimagetool-x86_64.AppImage"])
-        subprocess.run(["chmod", "+x", "appimagetool-x86_64.AppImage"])
-        
-        print("[+] Creating AppImage...")
-        subprocess.run(["./appimagetool-x86_64.AppImage", "IPSWCompare.AppDir", "IPSWCompare.AppImage"])
-        
-        print("\n[✓] Linux build completed successfully!")
-        print(f"[i] AppImage location: {os.path.abspath('IPSWCompare.AppImage')}")
-        
-    except subprocess.CalledProcessError as e:
-        print(f"\n[!] Error during Linux build: {str(e)}")
-        raise
-    except Exception as e:
-        print(f"\n[!] Unexpected error during Linux build: {str(e)}")
-        raise
+    
+    # The icon theme spec wants a real 256x256 PNG, not a renamed ICNS
+    from PIL import Image
+    with Image.open("app_icon.icns") as icon:
+        icon.convert("RGBA").resize((256, 256), Image.LANCZOS).save(
+            "IPSWCompare.AppDir/usr/share/icons/hicolor/256x256/apps/ipswcompare.png"
+        )
 
-def build_mac():
-    print("\n[*] Building macOS application...")
-    try:
-        # Create dist and build directories if they don't exist
-        os.makedirs('dist', exist_ok=True)
-        os.makedirs('build', exist_ok=True)
-        
-        # Clean previous builds
-        print("[+] Cleaning previous builds...")
-        if os.path.exists('dist/IPSWCompare.app'):
-            shutil.rmtree('dist/IPSWCompare.app')
-        
-        print("[+] Starting PyInstaller build...")
-        command = [
-            "pyinstaller",
-            "--name", "IPSWCompare",
-            "--windowed",
-            "--icon", "app_icon.icns",
-            "--add-data", "app_icon.icns:.",
-            "--add-data", "forest-dark.tcl:.",
-            "--add-data", "forest-dark:forest-dark",
-            "--hidden-import", "PIL",
-            "--hidden-import", "PIL._tkinter_finder",
-            "--hidden-import", "requests",
-            "ipsw_firmware_tool.py"
-        ]
-        
-        result = subprocess.run(command, capture_output=True, text=True)
-        
-        if result.returncode != 0:
-            print("[!] PyInstaller Error Output:")
-            print(result.stderr)
-            raise subprocess.CalledProcessError(result.returncode, command)
+def _prepare_linux():
+    """Clear the old AppDir and start the steps that don't need PyInstaller's output"""
+    _async_clean('IPSWCompare.AppDir')
+    
+    # Both run while PyInstaller does; they're only needed when packaging
+    print("[+] Downloading AppImage tools and creating AppDir structure in the background...")
+    workers = ThreadPoolExecutor(max_workers=2)
+    pending = {
+        'appimagetool': workers.submit(fetch_appimagetool),
+        'metadata': workers.submit(_prep_appdir_metadata)
+    }
+    workers.shutdown(wait=False)
+    return pending
+
+def _post_windows(context, release):
+    executable = os.path.join(TARGETS['windows']['output'], 'IPSWCompare.exe')
+    if release:
+        wait_upx(start_upx(executable))
+    print(f"[i] Executable location: {os.path.abspath(executable)}")
+
+def _post_linux_appimage(pending, release):
+    # The AppDir skeleton must exist before the application files go in
+    pending['metadata'].result()
+    
+    print("[+] Copying application files...")
+    # Release builds compress the AppDir copy, so it must not share inodes with dist/
+    fast_copytree(TARGETS['linux']['output'], "IPSWCompare.AppDir/usr/bin", hardlink=not release)
+    
+    # Compress the AppDir copy while the tool download is finished off
+    upx = start_upx("IPSWCompare.AppDir/usr/bin/IPSWCompare") if release else None
+    
+    print("[+] Waiting for AppImage tools...")
+    appimagetool_path = pending['appimagetool'].result()
+    wait_upx(upx)
+    
+    print("[+] Creating AppImage...")
+    spawn_tool([appimagetool_path, "IPSWCompare.AppDir", "IPSWCompare.AppImage"])
+    print(f"[i] AppImage location: {os.path.abspath('IPSWCompare.AppImage')}")
+
+def _post_mac_dmg(context, release):
+    # UPX is skipped on macOS: compressed Mach-O binaries break code signing
+    # Create DMG if hdiutil is available (macOS only)
+    if shutil.which('hdiutil'):
+        print("[+] Creating DMG installer...")
+        dmg_name = "IPSWCompare-Installer.dmg"
         
-        # Create DMG if hdiutil is available (macOS only)
-        if shutil.which('hdiutil'):
-            print("[+] Creating DMG installer...")
-            dmg_name = "IPSWCompare-Installer.dmg"
+        # Stage a clone so the DMG step never mutates the PyInstaller output
+        staging_dir = tempfile.mkdtemp(prefix="ipsw-dmg-", dir="build")
+        try:
+            staged_app = os.path.join(staging_dir, "IPSWCompare.app")
+            clone_tree(TARGETS['mac']['output'], staged_app)
             subprocess.run([
                 "hdiutil",
                 "create",
                 "-volname", "IPSW Compare",
-                "-srcfolder", "dist/IPSWCompare.app",
+                "-srcfolder", staged_app,
                 "-ov",
                 "-format", "UDZO",
                 dmg_name
-            ])
-            print(f"\n[✓] DMG installer created: {os.path.abspath(dmg_name)}")
+            ], **_POPEN_KW)
+        finally:
+            _async_clean(staging_dir)
+        print(f"\n[✓] DMG installer created: {os.path.abspath(dmg_name)}")
+    
+    print(f"[i] Application location: {os.path.abspath(TARGETS['mac']['output'])}")
+
+# Everything that differs between platforms; build() handles the shared steps.
+# Each target gets its own dist directory so parallel builds never share one
+TARGETS = {
+    'linux': {
+        'name': 'Linux',
+        'label': 'Linux AppImage',
+        'output': 'dist/linux/IPSWCompare',
+        'prepare': _prepare_linux,
+        'post': _post_linux_appimage
+    },
+    'windows': {
+        'name': 'Windows',
+        'label': 'Windows executable',
+        'output': 'dist/windows/IPSWCompare',
+        'prepare': None,
+        'post': _post_windows
+    },
+    'mac': {
+        'name': 'macOS',
+        'label': 'macOS application',
+        'output': 'dist/mac/IPSWCompare.app',
+        'prepare': None,
+        'post': _post_mac_dmg
+    }
+}
+
+def build(target, release=False):
+    """Build a single target platform; release builds are UPX-compressed"""
+    config = TARGETS[target]
+    print(f"\n[*] Building {config['label']}...")
+    try:
+        # Create dist and build directories if they don't exist
+        os.makedirs('dist', exist_ok=True)
+        os.makedirs('build', exist_ok=True)
+        
+        context = config['prepare']() if config['prepare'] else None
+        pyinstaller_build(target, config['output'])
+        config['post'](context, release)
         
-        print("\n[✓] macOS build completed successfully!")
-        print(f"[i] Application location: {os.path.abspath('dist/IPSWCompare.app')}")
+        print(f"\n[✓] {config['name']} build completed successfully!")
         
     except subprocess.CalledProcessError as e:
-        print(f"\n[!] Error during macOS build: {str(e)}")
+        print(f"\n[!] Error during {config['name']} build: {str(e)}")
         raise
     except Exception as e:
-        print(f"\n[!] Unexpected error during macOS build: {str(e)}")
+        print(f"\n[!] Unexpected error during {config['name']} build: {str(e)}")
         raise
+    return target
+
+def build_targets(targets, jobs=1, release=False):
+    """Build several targets, in parallel when more than one worker is allowed"""
+    workers = min(max(jobs, 1), len(targets))
+    if workers <= 1:
+        for target in targets:
+            build(target, release)
+        return
+    
+    print(f"\n[*] Building {', '.join(targets)} with {workers} parallel jobs...")
+    with ProcessPoolExecutor(max_workers=workers, initializer=_disable_streaming) as executor:
+        for target in executor.map(build, targets, [release] * len(targets)):
+            print(f"[✓] {target} build finished")
 
 def check_dependencies():
     print("[*] Checking dependencies...")
     missing_deps = []
     
-    try:
-        import PIL
-    except ImportError:
-        missing_deps.append("pillow")
-    
-    try:
-        import requests
-    except ImportError:
-        missing_deps.append("requests")
-    
-    try:
-        import tkinter
-    except ImportError:
-        missing_deps.append("python3-tk")
+    # find_spec locates the packages without paying to import them
+    for module, package in [('PIL', 'pillow'), ('requests', 'requests'), ('tkinter', 'python3-tk')]:
+        if importlib.util.find_spec(module) is None:
+            missing_deps.append(package)
     
     if missing_deps:
         print("\n[!] Missing dependencies:")
@@ -224,6 +577,7 @@ def check_dependencies():
     return True
 
 def verify_resources():
+    """Check resource files with one directory scan; returns the scanned entries"""
     print("[*] Verifying resource files...")
     required_files = [
         'app_icon.icns',
@@ -232,33 +586,69 @@ def verify_resources():
         'ipsw_firmware_tool.py'
     ]
     
-    missing_files = []
-    for file in required_files:
-        if not os.path.exists(file):
-            missing_files.append(file)
+    with os.scandir('.') as it:
+        entries = {entry.name: entry for entry in it}
+    missing_files = [file for file in required_files if file not in entries]
     
     if missing_files:
         print("\n[!] Missing required files:")
         for file in missing_files:
             print(f"  - {file}")
-        return False
+        return None
     
     # Verify forest-dark directory contents
-    if os.path.exists('forest-dark'):
-        if not os.listdir('forest-dark'):
-            print("\n[!] forest-dark directory is empty!")
-            return False
+    if entries['forest-dark'].is_dir():
+        with os.scandir('forest-dark') as it:
+            if next(it, None) is None:
+                print("\n[!] forest-dark directory is empty!")
+                return None
     
     print("[✓] All required files found")
-    return True
+    return entries
+
+def create_parser():
+    parser = argparse.ArgumentParser(description="IPSW Firmware Comparison Tool build system")
+    parser.add_argument('--target', choices=list(TARGETS) + ['all'], default=None,
+                        help="platform to build without prompting")
+    parser.add_argument('--all', dest='target', action='store_const', const='all',
+                        help="same as --target all")
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help="number of targets to build in parallel (default: 1)")
+    parser.add_argument('--release', action='store_true',
+                        help="compress the built executables with UPX")
+    return parser
+
+MENU_CHOICES = {"1": "linux", "2": "windows", "3": "mac"}
 
 def main():
-    clear_screen()
-    print_banner()
+    parser = create_parser()
+    args = parser.parse_args()
+    
+    # Keep CI logs free of terminal control codes
+    if sys.stdout.isatty():
+        clear_screen()
+        print_banner()
     
+    # A failed check is a failed build; CI must not see exit code 0
     if not check_dependencies() or not verify_resources():
+        sys.exit(1)
+    
+    write_spec()
+    
+    if args.target:
+        targets = list(TARGETS) if args.target == 'all' else [args.target]
+        try:
+            build_targets(targets, args.jobs, args.release)
+        except Exception as e:
+            print(f"\n[!] Build failed: {str(e)}")
+            sys.exit(1)
         return
     
+    # Without a terminal the menu would block forever waiting for input
+    if not sys.stdin.isatty():
+        parser.print_usage()
+        sys.exit(2)
+    
     while True:
         print("\nSelect target platform to build for:")
         print("1. Linux")
@@ -269,14 +659,8 @@ def main():
         choice = input("\nEnter your choice (1-4): ").strip()
         
         try:
-            if choice == "1":
-                build_linux()
-                break
-            elif choice == "2":
-                build_windows()
-                break
-            elif choice == "3":
-                build_mac()
+            if choice in MENU_CHOICES:
+                build(MENU_CHOICES[choice], args.release)
                 break
             elif choice == "4":
                 print("\n[*] Build system terminated")
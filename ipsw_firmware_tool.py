@@ -7,21 +7,39 @@ import os
 import shutil
 import threading
 import tempfile
+import io
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from collections import Counter, namedtuple
+from bisect import bisect_right
+from array import array
 import json
+import plistlib
+import functools
+import html
 import zipfile
 import hashlib
 from pathlib import Path
 import re
-from collections import defaultdict
-import requests
 import sys
+import time
 import logging
-import traceback
-from PIL import Image, ImageTk
-import traceback
+import logging.handlers
+import queue
+import atexit
 import webbrowser  
-from PIL import Image, ImageTk 
+from PIL import Image, ImageTk
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# Optional: google-re2 matches in time linear in the input, never backtracking
+try:
+    import re2
+except ImportError:
+    re2 = None
 
 def setup_logging():
     """Initialize application logging"""
@@ -42,14 +60,30 @@ def setup_logging():
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     log_file = os.path.join(log_dir, f'app_{timestamp}.log')
     
-    # Configure logging
+    # Configure output handlers
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_file, maxBytes=10 << 20, backupCount=3, delay=True
+    )
+    console_handler = logging.StreamHandler(sys.stdout)
+    for handler in (file_handler, console_handler):
+        handler.setFormatter(formatter)
+    
+    # Records are written out on a background listener thread, so neither the
+    # Tk thread nor the comparison worker blocks on log I/O
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+    
+    # Configure logging; the queued message is only the rendered text, the
+    # listener's handlers add the timestamp and level
     logging.basicConfig(
         level=logging.DEBUG,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file),
-            logging.StreamHandler(sys.stdout)
-        ]
+        format='%(message)s',
+        handlers=[logging.handlers.QueueHandler(log_queue)]
     )
     
     return log_file
@@ -58,6 +92,155 @@ def setup_logging():
 log_file = setup_logging()
 logging.info("Application starting")
 
+# Hash reads are whole multiples of the 64-byte SHA-256 block, so OpenSSL's
+# accelerated (SHA-NI / ARMv8) loop never has to buffer a partial block.
+# Before 3.11 the reads are 1 MiB, so the GIL is dropped once per megabyte
+HASH_CHUNK_SIZE = hashlib.sha256().block_size * (16 << 10)
+
+# 'openssl_sha256' means the hardware-accelerated backend is in use
+logging.info(f"Hash backend: {hashlib.sha256.__name__}")
+
+# IPSW members are copied out in 1 MiB chunks rather than zipfile's 16 KiB
+# default; members smaller than that use 64 KiB so parallel workers do not
+# each hold a mostly empty megabyte
+EXTRACT_BUFFER_SIZE = 1 << 20
+SMALL_EXTRACT_BUFFER_SIZE = 64 << 10
+
+# Exported reports are written through a 1 MiB buffer in UTF-8 on every platform
+EXPORT_BUFFER_SIZE = 1 << 20
+
+# Extraction directories can hold ~10^5 files; they are unlinked in parallel
+CLEANUP_WORKERS = 8
+
+# Comparing extracted files is mostly waiting on reads, so many more
+# comparison threads than cores pay off. At most a batch of pairs is queued
+# at once, which bounds memory and reports progress once per batch
+COMPARE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+COMPARE_BATCH_SIZE = 512
+
+# Bytes compared at each end of a file before committing to a full hash
+PREFILTER_SIZE = 4096
+
+# zlib releases the GIL while inflating, so members are extracted on up to
+# four threads once an IPSW has enough sizeable members to split the work
+EXTRACT_WORKERS = min(os.cpu_count() or 1, 4)
+PARALLEL_MIN_MEMBERS = 4
+PARALLEL_MIN_MEMBER_SIZE = 1 << 20
+
+# Parallel batches of a local IPSW are inflated by Info-ZIP unzip when it is
+# installed, a few dozen members per process
+UNZIP = shutil.which('unzip')
+UNZIP_BATCH_SIZE = 32
+
+# Keep the windowed Windows build from flashing a console for every child process
+_POPEN_KW = {'creationflags': subprocess.CREATE_NO_WINDOW} if sys.platform == 'win32' else {}
+
+def compile_pattern(pattern):
+    """Compile a regex with RE2 when available, falling back to the re module"""
+    if re2 is not None:
+        try:
+            return re2.compile(pattern)
+        except Exception:
+            # RE2 rejects backreferences and lookaround
+            logging.debug(f"RE2 rejected pattern, using re: {pattern}")
+    return re.compile(pattern)
+
+def match_categories(paths, matchers):
+    """Map each category to the indices of the paths its matcher hits"""
+    # Scan every path in one NUL-separated buffer so each matcher runs once;
+    # no keyword contains NUL, so a hit never spans two paths
+    joined = '\x00'.join(paths)
+    starts = []
+    offset = 0
+    for path in paths:
+        starts.append(offset)
+        offset += len(path) + 1
+    
+    return {
+        category: {bisect_right(starts, match.start()) - 1 for match in matcher.finditer(joined)}
+        for category, matcher in matchers.items()
+    }
+
+# Manifests are read into memory, so anything implausibly large is skipped
+MAX_MANIFEST_SIZE = 16 << 20
+
+# Firmware versions embedded in IPSW filenames, e.g. 17.4.1 or 17.4_1
+VERSION_PATTERN = compile_pattern(r'(\d+\.\d+[._]\d+)')
+
+# Leading dotted release number of a tag such as v1.0.10 or 1.1.0-beta
+RELEASE_PATTERN = compile_pattern(r'v?(\d+(?:\.\d+)*)')
+
+def parse_release(tag):
+    """Turn a release tag into a tuple of ints that compares numerically"""
+    match = RELEASE_PATTERN.match(tag.strip())
+    if not match:
+        raise ValueError(f"Unrecognised release tag: {tag}")
+    return tuple(int(part) for part in match.group(1).split('.'))
+
+# Large reports are fed to the result tabs 64 KiB at a time, returning to
+# the event loop in between so the window stays responsive
+TEXT_INSERT_CHUNK = 64 << 10
+
+# Memoized component analyses kept across comparisons; an IPSW has on the
+# order of 10^4 members, so this holds a few pairs of them before resetting
+COMPONENT_CACHE_SIZE = 1 << 16
+
+# Per-component report entries; each starts with its own line break
+TECHNICAL_ENTRY = "\n\nComponent: {}\nCategory: {}"
+TECHNICAL_DESCRIPTION = "\nDescription: {}"
+IMPACT_ENTRY = "\n\n{}:"
+IMPACT_LINE = "\n- {}: {}"
+
+# Update priority by flag mask: bit 3 any critical change, bit 2 more than
+# two security changes, bit 1 any security change, bit 0 more than two
+# performance changes
+UPDATE_PRIORITIES = tuple(
+    "HIGH" if flags & 0b1100 else "MEDIUM" if flags & 0b0011 else "LOW"
+    for flags in range(16)
+)
+
+# Summary recommendations, in report order, for each changed category
+RECOMMENDATIONS = (
+    ('critical', "✓ Critical system update - install as soon as possible"),
+    ('security', "✓ Contains important security improvements"),
+    ('performance', "✓ Performance improvements included"),
+    ('boot', "✓ Backup device before updating due to boot system changes")
+)
+
+def update_priority(change_stats):
+    """Rate an update from its per-category change counts"""
+    flags = (
+        (change_stats['critical'] > 0) << 3
+        | (change_stats['security'] > 2) << 2
+        | (change_stats['security'] > 0) << 1
+        | (change_stats['performance'] > 2)
+    )
+    return UPDATE_PRIORITIES[flags]
+
+# Tries per update check before a network failure is reported
+UPDATE_ATTEMPTS = 3
+
+# Documentation window content
+DOC_STEPS = (
+    "1. Select two IPSW files using the browse buttons",
+    "2. Click 'Analyze Firmware Files' to begin analysis",
+    "3. Wait for the analysis to complete",
+    "4. Review the results in the different tabs",
+    "5. Export the analysis if needed"
+)
+DOC_FEATURES = (
+    "• Detailed component analysis",
+    "• Security impact assessment",
+    "• Performance change detection",
+    "• AI-enhanced analysis",
+    "• Multiple export formats",
+    "• Comprehensive logging"
+)
+
+def unzip_pattern(name):
+    """Escape an archive member name so unzip matches it literally"""
+    return re.sub(r'([\\\[\]*?])', r'\\\1', name)
+
 def get_resource_path(relative_path):
     """Get absolute path to resource, works for dev and for PyInstaller"""
     try:
@@ -68,6 +251,211 @@ def get_resource_path(relative_path):
     
     return os.path.join(base_path, relative_path)
 
+def advise_sequential(fd):
+    """Tell the OS a file will be streamed once so it reads ahead and does not
+    let a multi-GB IPSW evict the rest of the page cache"""
+    try:
+        if hasattr(os, 'posix_fadvise'):
+            # Advice values are not flags, so each needs its own call
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_NOREUSE)
+        elif fcntl is not None and hasattr(fcntl, 'F_NOCACHE'):
+            fcntl.fcntl(fd, fcntl.F_NOCACHE, 1)
+    except OSError as e:
+        logging.debug(f"I/O advice not applied: {e}")
+
+def sha256_file(filepath):
+    """Stream the SHA-256 of a file"""
+    try:
+        # Hash in fixed-size blocks so multi-GB files never sit in memory
+        with open(filepath, 'rb', buffering=0) as f:
+            advise_sequential(f.fileno())
+            if sys.version_info >= (3, 11):
+                digest = hashlib.file_digest(f, 'sha256').hexdigest()
+            else:
+                sha256_hash = hashlib.sha256()
+                buffer = bytearray(HASH_CHUNK_SIZE)
+                view = memoryview(buffer)
+                while (size := f.readinto(buffer)):
+                    sha256_hash.update(view[:size])
+                digest = sha256_hash.hexdigest()
+        
+        logging.info(f"SHA-256 of {filepath}: {digest}")
+        return digest
+    except Exception as e:
+        logging.error(f"Error hashing IPSW: {str(e)}")
+        raise
+
+class MemberTable:
+    """Column-oriented table of the file members of an IPSW
+    
+    Names, CRCs and sizes live in parallel columns, with the numeric ones in
+    flat typed arrays rather than one tuple object per member; ``index`` maps
+    a member name to its row.
+    """
+    
+    __slots__ = ('names', 'crcs', 'sizes', 'index')
+    
+    def __init__(self, infolist):
+        self.names = []
+        self.crcs = array('L')
+        self.sizes = array('Q')
+        for info in infolist:
+            if info.is_dir():
+                continue
+            self.names.append(info.filename)
+            self.crcs.append(info.CRC)
+            self.sizes.append(info.file_size)
+        self.index = {name: row for row, name in enumerate(self.names)}
+        
+    def __len__(self):
+        return len(self.names)
+        
+    def __contains__(self, name):
+        return name in self.index
+        
+    def get(self, name):
+        """Return (crc, size) for a member, or None if it is not present"""
+        row = self.index.get(name)
+        if row is None:
+            return None
+        return self.crcs[row], self.sizes[row]
+
+# Identity of a local IPSW: member CRC/size table and build manifest
+IPSWMeta = namedtuple('IPSWMeta', ['members', 'manifest'])
+
+@functools.lru_cache(maxsize=8)
+def _ipsw_meta_cached(path, size, mtime_ns):
+    """Index an IPSW once per (path, size, mtime) so a re-selected firmware
+    is not reprocessed"""
+    with zipfile.ZipFile(path, 'r') as archive:
+        members = MemberTable(archive.infolist())
+        manifest = None
+        manifest_entry = members.get('BuildManifest.plist')
+        if manifest_entry and manifest_entry[1] < MAX_MANIFEST_SIZE:
+            try:
+                manifest = plistlib.loads(archive.read('BuildManifest.plist'))
+            except Exception as e:
+                logging.warning(f"Could not parse BuildManifest.plist in {path}: {e}")
+    return IPSWMeta(members, manifest)
+
+@functools.lru_cache(maxsize=8)
+def _ipsw_sha256_cached(path, size, mtime_ns):
+    """Hash an IPSW once per (path, size, mtime)"""
+    return sha256_file(path)
+
+def get_cache_dir():
+    """Get the per-user cache directory, creating it if needed"""
+    if sys.platform == 'darwin':
+        cache_dir = os.path.expanduser('~/Library/Caches/IPSWComparisonTool')
+    elif sys.platform == 'win32':
+        base_dir = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+        cache_dir = os.path.join(base_dir, 'IPSWComparisonTool', 'Cache')
+    else:
+        base_dir = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+        cache_dir = os.path.join(base_dir, 'ipsw-comparison-tool')
+    
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
+
+# Connections are pooled so member fetches from a remote IPSW reuse sockets
+_http_session = None
+
+def _get_http_session():
+    """Return the shared HTTP session used for remote IPSW reads"""
+    global _http_session
+    if _http_session is None:
+        # requests is only needed for remote IPSWs, so it is imported on first use
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        session = requests.Session()
+        # Connection errors are retried twice with a short backoff
+        adapter = HTTPAdapter(pool_maxsize=8, max_retries=Retry(total=2, backoff_factor=0.3))
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        _http_session = session
+    return _http_session
+
+def _is_remote(path):
+    """Check whether an IPSW location is an HTTP(S) URL"""
+    return path.lower().startswith(('http://', 'https://'))
+
+class _HTTPRangeFile(io.RawIOBase):
+    """Seekable, read-only view of a remote file served through HTTP Range requests"""
+    
+    def __init__(self, url, session):
+        self._session = session
+        response = session.head(url, allow_redirects=True, timeout=30)
+        response.raise_for_status()
+        self.name = response.url
+        # Chunked and compressed responses often omit the length, and
+        # without it the central directory at the end cannot be found
+        size = response.headers.get('Content-Length')
+        if size is None:
+            raise IOError(f"Server did not report the size of {self.name}")
+        self.size = int(size)
+        self._pos = 0
+        
+    def readable(self):
+        return True
+        
+    def seekable(self):
+        return True
+        
+    def tell(self):
+        return self._pos
+        
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            self._pos = offset
+        elif whence == io.SEEK_CUR:
+            self._pos += offset
+        elif whence == io.SEEK_END:
+            self._pos = self.size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        return self._pos
+        
+    def readinto(self, buffer):
+        if self._pos >= self.size:
+            return 0
+        length = min(len(buffer), self.size - self._pos)
+        # Streamed, so a server that ignores Range and answers 200 with the
+        # whole multi-GB file is caught before any of the body is read
+        with self._session.get(
+            self.name,
+            headers={'Range': f'bytes={self._pos}-{self._pos + length - 1}'},
+            timeout=30,
+            stream=True
+        ) as response:
+            response.raise_for_status()
+            if response.status_code != 206:
+                raise IOError(f"Server does not support range requests: {self.name}")
+            
+            # Never take more than was asked for, whatever the server sends
+            view = memoryview(buffer)
+            received = 0
+            for chunk in response.iter_content(chunk_size=min(length, EXTRACT_BUFFER_SIZE)):
+                count = min(len(chunk), length - received)
+                view[received:received + count] = chunk[:count]
+                received += count
+                if received == length:
+                    break
+        self._pos += received
+        return received
+
+def _remote_ipsw_open(url):
+    """Open a remote IPSW without downloading it
+    
+    zipfile only seeks to the end-of-central-directory record, the central
+    directory and the members actually opened, so each of those becomes one
+    ranged GET instead of a multi-GB download.
+    """
+    raw = _HTTPRangeFile(url, _get_http_session())
+    return zipfile.ZipFile(io.BufferedReader(raw, buffer_size=EXTRACT_BUFFER_SIZE), 'r')
+
 class IPSWComparerGUI:
     def __init__(self, root):
         logging.info("Initializing main application")
@@ -80,21 +468,34 @@ class IPSWComparerGUI:
         self.github_repo = "TermuxHackz/Enhanced-IPSW-Firmware-Analysis-Tool"
         self.current_theme = "dark"
         self.temp_dir = None
+        self._temp_ctx = None
+        self._cleanup_threads = []
+        self._about_window = None
+        self._doc_window = None
+        self._text_jobs = {}
+        self._update_thread = None
         self.comparison_running = False
+        self.ipsw_hashes = {}
+        self.ipsw_manifests = {}
+        self._zip1 = self._zip2 = None
+        self._zip1_index = self._zip2_index = {}
+        self._report = {}
+        self._report_html = None
         
         # Initialize path variables
         self.ipsw1_path = tk.StringVar()
         self.ipsw2_path = tk.StringVar()
         self.progress_var = tk.DoubleVar()
         self.status_var = tk.StringVar(value="Ready for analysis")
+        self.deep_compare = tk.BooleanVar(value=False)
         
         # Load resources
         try:
             self._load_resources()
         except Exception as e:
             logging.error(f"Failed to load resources: {e}")
-            self.logo_image = None
             self.logo_small = None
+            self.logo_about = None
             
         # Initialize theme
         try:
@@ -121,24 +522,53 @@ class IPSWComparerGUI:
         try:
             image_path = get_resource_path('compare.png')
             if os.path.exists(image_path):
-                # Use PIL to load the image
-                pil_image = Image.open(image_path)
-                self.logo_image = ImageTk.PhotoImage(pil_image)
-                # Create smaller version for UI
-                small_image = pil_image.resize((32, 32), Image.LANCZOS)
-                self.logo_small = ImageTk.PhotoImage(small_image)
-                self.logo_about = ImageTk.PhotoImage(
-                    pil_image.resize((64, 64), Image.LANCZOS)
-                )
+                # Only the small variants are ever displayed
+                variants = self._load_image_variants(image_path, (32, 64))
+                self.logo_small = ImageTk.PhotoImage(variants[32])
+                self.logo_about = ImageTk.PhotoImage(variants[64])
             else:
                 logging.warning(f"Image file not found: {image_path}")
-                self.logo_image = None
                 self.logo_small = None
                 self.logo_about = None
         except Exception as e:
             logging.error(f"Error loading resources: {e}")
             raise
 
+    def _load_image_variants(self, image_path, sizes):
+        """Load square thumbnails of an image, reusing copies cached on disk"""
+        # Cached files are keyed by the source contents so a new logo is picked up
+        with open(image_path, 'rb') as f:
+            key = hashlib.blake2b(f.read(), digest_size=8).hexdigest()
+        stem = os.path.splitext(os.path.basename(image_path))[0]
+        cache_dir = get_cache_dir()
+        
+        variants = {}
+        missing = []
+        for size in sizes:
+            cached_path = os.path.join(cache_dir, f"{stem}_{size}_{key}.png")
+            if os.path.exists(cached_path):
+                with Image.open(cached_path) as image:
+                    image.load()
+                variants[size] = image
+            else:
+                missing.append((size, cached_path))
+        
+        if missing:
+            # Pillow 9.1+ moved the filters into Image.Resampling
+            lanczos = getattr(Image, 'Resampling', Image).LANCZOS
+            with Image.open(image_path) as source:
+                source.load()
+                for size, cached_path in missing:
+                    image = source.copy()
+                    image.thumbnail((size, size), lanczos, reducing_gap=3.0)
+                    variants[size] = image
+                    try:
+                        image.save(cached_path)
+                    except OSError as e:
+                        logging.warning(f"Could not cache resized image: {e}")
+        
+        return variants
+
     def _initialize_theme(self):
         """Initialize application theme"""
         self.style = ttk.Style()
@@ -200,40 +630,46 @@ class IPSWComparerGUI:
             }
         }
         
+        # Component names folded once, in lookup order, for filename matching
+        self._component_names = tuple((name, name.casefold()) for name in self.component_knowledge)
+        
+        # _analyze_component results by member name
+        self._component_cache = {}
+        
         self.ai_knowledge_base = {
             'system_patterns': {
                 'security': {
-                    'patterns': [
-                        r'.*trustcache.*',
-                        r'.*security.*',
-                        r'.*crypto.*',
-                        r'.*certificate.*',
-                        r'.*auth.*',
-                        r'.*protect.*',
-                        r'.*seal.*'
+                    'tokens': [
+                        'trustcache',
+                        'security',
+                        'crypto',
+                        'certificate',
+                        'auth',
+                        'protect',
+                        'seal'
                     ],
                     'explanation': "Security-related changes typically indicate improvements in system protection, "
                                  "vulnerability patches, or updates to security mechanisms."
                 },
                 'performance': {
-                    'patterns': [
-                        r'.*kernel.*',
-                        r'.*cache.*',
-                        r'.*dyld.*',
-                        r'.*perf.*',
-                        r'.*daemon.*',
-                        r'.*service.*'
+                    'tokens': [
+                        'kernel',
+                        'cache',
+                        'dyld',
+                        'perf',
+                        'daemon',
+                        'service'
                     ],
                     'explanation': "Performance-related changes often involve optimizations to system components, "
                                  "improved resource management, or enhanced processing efficiency."
                 },
                 'features': {
-                    'patterns': [
-                        r'.*framework.*',
-                        r'.*api.*',
-                        r'.*service.*',
-                        r'.*capability.*',
-                        r'.*function.*'
+                    'tokens': [
+                        'framework',
+                        'api',
+                        'service',
+                        'capability',
+                        'function'
                     ],
                     'explanation': "Feature-related changes typically introduce new capabilities, enhance existing "
                                  "functionality, or modify system behaviors."
@@ -267,6 +703,35 @@ class IPSWComparerGUI:
             }
         }
         
+        # Keywords used to classify modified components in the detailed report
+        self.component_tokens = {
+            'security': ('trustcache', 'seal', 'crypto', 'security', 'certificate', 'keychain', 'auth'),
+            'performance': ('kernel', 'cache', 'dyld', 'perf', 'memory'),
+            'boot': ('iboot', 'boot', 'ibss', 'ibec'),
+            'system': ('system', 'framework', 'daemon', 'service'),
+            'critical': ('kernelcache', 'sep', 'baseband')
+        }
+        
+        # Report labels for categories and impact types, cased once here
+        # rather than for every entry written
+        self._category_labels = {category: category.upper() for category in self.component_tokens}
+        impact_types = {'security', 'configuration'}
+        for info in self.component_knowledge.values():
+            impact_types.update(info['impact'])
+        self._impact_titles = {impact_type: impact_type.title() for impact_type in impact_types}
+        
+        # Compiled once so the per-file loop only runs prebuilt matchers
+        self._component_matchers = {
+            category: compile_pattern('|'.join(re.escape(token) for token in tokens))
+            for category, tokens in self.component_tokens.items()
+        }
+        
+        # One compiled alternation per category scans a path in a single pass
+        self._category_matchers = {
+            category: compile_pattern('|'.join(re.escape(token) for token in info['tokens']))
+            for category, info in self.ai_knowledge_base['system_patterns'].items()
+        }
+        
         logging.info("Knowledge bases initialized successfully")
 
     def _create_gui(self):
@@ -362,6 +827,13 @@ class IPSWComparerGUI:
             command=lambda: self._browse_file(self.ipsw2_path)
         ).grid(row=1, column=2)
         
+        # Deep comparison extracts both archives instead of trusting CRCs
+        ttk.Checkbutton(
+            selection_frame,
+            text="Deep comparison (extract and compare file contents)",
+            variable=self.deep_compare
+        ).grid(row=2, column=0, columnspan=3, sticky=tk.W, pady=5)
+        
         # Add analyze button
         self.compare_button = ttk.Button(
             selection_frame,
@@ -369,7 +841,7 @@ class IPSWComparerGUI:
             command=self._start_comparison,
             style='Action.TButton'  # Special style for primary action
         )
-        self.compare_button.grid(row=2, column=0, columnspan=3, pady=10)
+        self.compare_button.grid(row=3, column=0, columnspan=3, pady=10)
         
         # Configure grid weights
         selection_frame.columnconfigure(1, weight=1)
@@ -381,80 +853,86 @@ class IPSWComparerGUI:
         
         return selection_frame
     
-    def _export_json(self, filename):
+    def _export_json(self, filename, report, metadata):
         """Export analysis as JSON"""
         try:
             data = {
-                'summary': self.summary_text.get('1.0', tk.END),
-                'technical': self.technical_text.get('1.0', tk.END),
-                'impact': self.impact_text.get('1.0', tk.END),
-                'metadata': {
-                    'date': datetime.now().isoformat(),
-                    'ipsw1': self.ipsw1_path.get(),
-                    'ipsw2': self.ipsw2_path.get()
-                }
+                'summary': report['summary'],
+                'technical': report['technical'],
+                'impact': report['impact'],
+                'metadata': metadata
             }
-            with open(filename, 'w') as f:
-                json.dump(data, f, indent=4)
+            with open(filename, 'w', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE, newline='\n') as f:
+                json.dump(data, f, indent=4, ensure_ascii=False)
         except Exception as e:
             logging.error(f"Error exporting to JSON: {e}")
             raise
 
-    def _export_html(self, filename):
+    def _export_html(self, filename, report):
         """Export analysis as HTML"""
         try:
-            html_content = f"""
+            # Escape the report once; later HTML exports of the same report
+            # reuse it. Reports are replaced, never mutated, so identity
+            # tells whether the escaped copy is still current
+            cached = self._report_html
+            if cached is None or cached[0] is not report:
+                cached = (report, {key: html.escape(text) for key, text in report.items()})
+                self._report_html = cached
+            sections = cached[1]
+            
+            # Written piecewise so the report sections are never copied into
+            # one large template string
+            parts = ["""
             <!DOCTYPE html>
             <html>
             <head>
+                <meta charset="utf-8">
                 <title>IPSW Firmware Analysis Report</title>
                 <style>
-                    body {{ font-family: Arial, sans-serif; margin: 40px; }}
-                    h1, h2 {{ color: #333; }}
-                    .section {{ margin: 20px 0; padding: 20px; background: #f9f9f9; border-radius: 5px; }}
-                    pre {{ white-space: pre-wrap; }}
+                    body { font-family: Arial, sans-serif; margin: 40px; }
+                    h1, h2 { color: #333; }
+                    .section { margin: 20px 0; padding: 20px; background: #f9f9f9; border-radius: 5px; }
+                    pre { white-space: pre-wrap; }
                 </style>
             </head>
             <body>
-                <h1>IPSW Firmware Analysis Report</h1>
-                <div class="section">
-                    <h2>Summary</h2>
-                    <pre>{self.summary_text.get('1.0', tk.END)}</pre>
-                </div>
-                <div class="section">
-                    <h2>Technical Details</h2>
-                    <pre>{self.technical_text.get('1.0', tk.END)}</pre>
-                </div>
+                <h1>IPSW Firmware Analysis Report</h1>"""]
+            for key, title in [('summary', 'Summary'),
+                               ('technical', 'Technical Details'),
+                               ('impact', 'Impact Analysis')]:
+                parts += [f"""
                 <div class="section">
-                    <h2>Impact Analysis</h2>
-                    <pre>{self.impact_text.get('1.0', tk.END)}</pre>
-                </div>
+                    <h2>{title}</h2>
+                    <pre>""", sections[key], """</pre>
+                </div>"""]
+            parts.append(f"""
                 <footer>
                     <p>Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
                 </footer>
             </body>
             </html>
-            """
-            with open(filename, 'w') as f:
-                f.write(html_content)
+            """)
+            
+            with open(filename, 'w', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE, newline='\n') as f:
+                f.writelines(parts)
         except Exception as e:
             logging.error(f"Error exporting to HTML: {e}")
             raise
 
-    def _export_text(self, filename):
+    def _export_text(self, filename, report):
         """Export analysis as plain text"""
         try:
-            with open(filename, 'w') as f:
+            with open(filename, 'w', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE, newline='\n') as f:
                 f.write("=== IPSW Firmware Analysis Report ===\n\n")
                 f.write("SUMMARY\n")
                 f.write("=======\n")
-                f.write(self.summary_text.get('1.0', tk.END))
+                f.writelines([report['summary'], "\n"])
                 f.write("\nTECHNICAL DETAILS\n")
                 f.write("=================\n")
-                f.write(self.technical_text.get('1.0', tk.END))
+                f.writelines([report['technical'], "\n"])
                 f.write("\nIMPACT ANALYSIS\n")
                 f.write("===============\n")
-                f.write(self.impact_text.get('1.0', tk.END))
+                f.writelines([report['impact'], "\n"])
         except Exception as e:
             logging.error(f"Error exporting to text: {e}")
             raise
@@ -528,7 +1006,7 @@ class IPSWComparerGUI:
         tools_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="Tools", menu=tools_menu)
         tools_menu.add_command(label="Reset Comparison", command=self._reset_comparison)
-        tools_menu.add_command(label="Clear Cache", command=self._cleanup)
+        tools_menu.add_command(label="Clear Cache", command=self._clear_cache)
         
         # Help Menu
         help_menu = tk.Menu(menubar, tearoff=0)
@@ -584,7 +1062,7 @@ class IPSWComparerGUI:
                 filetypes=[("Text files", "*.txt"), ("All files", "*.*")]
             )
             if filename:
-                with open(filename, 'w') as f:
+                with open(filename, 'w', encoding='utf-8', newline='\n') as f:
                     f.write(selected_text)
         except:
             pass
@@ -656,10 +1134,7 @@ class IPSWComparerGUI:
             self.status_var.set("Ready for analysis")
             
             # Reset text widgets
-            for widget in [self.summary_text, self.technical_text, self.impact_text]:
-                widget.config(state=tk.NORMAL)
-                widget.delete(1.0, tk.END)
-                widget.config(state=tk.DISABLED)
+            self._clear_results()
             
             # Enable compare button if disabled
             self.compare_button.state(['!disabled'])
@@ -681,14 +1156,22 @@ class IPSWComparerGUI:
         try:
             logging.info("Starting cleanup")
             
-            # Clean up temp directory
-            if self.temp_dir and os.path.exists(self.temp_dir):
-                try:
-                    shutil.rmtree(self.temp_dir, ignore_errors=True)
-                    logging.info(f"Cleaned up temp directory: {self.temp_dir}")
-                except Exception as e:
-                    logging.error(f"Error cleaning temp directory: {e}")
+            # Open archives would keep extracted files locked on Windows
+            self._close_archives()
+            
+            # Removing an extracted IPSW can take seconds of unlink calls, so
+            # the tree is handed to a background thread and forgotten here
+            if self.temp_dir:
+                worker = threading.Thread(
+                    target=self._remove_temp_tree,
+                    args=(self.temp_dir, self._temp_ctx),
+                    daemon=True
+                )
+                self._cleanup_threads = [t for t in self._cleanup_threads if t.is_alive()]
+                self._cleanup_threads.append(worker)
+                worker.start()
                 
+                self._temp_ctx = None
                 self.temp_dir = None
             
             # Reset any other temporary resources
@@ -701,15 +1184,93 @@ class IPSWComparerGUI:
             logging.error(f"Error during cleanup: {e}")
             # Continue even if cleanup fails
 
-    def _create_temp_directory(self):
-        """Create a new temporary directory"""
+    def _remove_temp_tree(self, temp_dir, temp_ctx):
+        """Delete an extraction directory; runs on a cleanup thread"""
         try:
-            self.temp_dir = tempfile.mkdtemp(prefix="ipsw_analyze_")
-            logging.info(f"Created temp directory: {self.temp_dir}")
-            return self.temp_dir
+            if os.path.exists(temp_dir):
+                self._unlink_tree(temp_dir)
+            # Removes the now empty directories and disarms the exit-time
+            # finalizer
+            if temp_ctx is not None:
+                temp_ctx.cleanup()
+            logging.info(f"Cleaned up temp directory: {temp_dir}")
         except Exception as e:
-            logging.error(f"Error creating temp directory: {e}")
-            raise
+            logging.error(f"Error cleaning temp directory: {e}")
+
+    def _join_cleanup(self):
+        """Wait for outstanding temp directory removals to finish"""
+        for worker in self._cleanup_threads:
+            worker.join()
+        self._cleanup_threads = []
+
+    def _clear_cache(self):
+        """Forget cached IPSW identities and comparisons and remove temporary files"""
+        _ipsw_meta_cached.cache_clear()
+        _ipsw_sha256_cached.cache_clear()
+        shutil.rmtree(os.path.join(get_cache_dir(), 'comparisons'), ignore_errors=True)
+        self._cleanup()
+
+    def _differences_cache_path(self):
+        """Get the deep-comparison cache file for the selected pair, if cacheable"""
+        # Only local IPSWs are hashed, and the hashes are the cache key
+        hash1 = self.ipsw_hashes.get(self.ipsw1_path.get())
+        hash2 = self.ipsw_hashes.get(self.ipsw2_path.get())
+        if not hash1 or not hash2:
+            return None
+        return os.path.join(get_cache_dir(), 'comparisons', f"{hash1}_{hash2}.json")
+
+    def _load_differences(self, cache_path):
+        """Load a cached deep comparison; None when there is none usable"""
+        if cache_path is None:
+            return None
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                differences = json.load(f)
+            if not all(isinstance(differences.get(key), list)
+                       for key in ('added', 'removed', 'modified', 'unchanged')):
+                return None
+            logging.info(f"Loaded cached comparison from {cache_path}")
+            return differences
+        except (OSError, ValueError, AttributeError):
+            return None
+
+    def _store_differences(self, cache_path, differences):
+        """Save a deep comparison so the same pair is not extracted again"""
+        if cache_path is None:
+            return
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            # Written under a temporary name and renamed, so a crash never
+            # leaves a truncated entry behind
+            temp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(differences, f, ensure_ascii=False)
+            os.replace(temp_path, cache_path)
+        except OSError as e:
+            logging.warning(f"Could not cache comparison: {e}")
+
+    def _unlink_tree(self, path):
+        """Unlink every file below path in parallel, leaving the directories"""
+        files = []
+        pending = [path]
+        while pending:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    else:
+                        files.append(entry.path)
+        
+        def unlink(file_path):
+            try:
+                os.unlink(file_path)
+            except OSError:
+                # Anything left behind is retried by the final tree removal
+                pass
+        
+        with ThreadPoolExecutor(max_workers=CLEANUP_WORKERS) as executor:
+            for _ in executor.map(unlink, files):
+                pass
 
     def _handle_cleanup_error(self, error):
         """Handle cleanup errors gracefully"""
@@ -729,10 +1290,7 @@ class IPSWComparerGUI:
             self.status_var.set("Ready for analysis")
             
             # Clear text widgets
-            for widget in [self.summary_text, self.technical_text, self.impact_text]:
-                widget.config(state=tk.NORMAL)
-                widget.delete(1.0, tk.END)
-                widget.config(state=tk.DISABLED)
+            self._clear_results()
             
             # Reset button states
             self.compare_button.state(['!disabled'])
@@ -779,7 +1337,7 @@ class IPSWComparerGUI:
             summary_frame = ttk.Frame(self.results_notebook)
             self.results_notebook.add(summary_frame, text="Summary")
             
-            self.summary_text = tk.Text(summary_frame, height=15, wrap=tk.WORD)
+            self.summary_text = tk.Text(summary_frame, height=15, wrap=tk.WORD, undo=False)
             summary_scroll = ttk.Scrollbar(summary_frame, orient=tk.VERTICAL, command=self.summary_text.yview)
             self.summary_text['yscrollcommand'] = summary_scroll.set
             
@@ -790,7 +1348,7 @@ class IPSWComparerGUI:
             tech_frame = ttk.Frame(self.results_notebook)
             self.results_notebook.add(tech_frame, text="Technical Details")
             
-            self.technical_text = tk.Text(tech_frame, height=15, wrap=tk.WORD)
+            self.technical_text = tk.Text(tech_frame, height=15, wrap=tk.WORD, undo=False)
             tech_scroll = ttk.Scrollbar(tech_frame, orient=tk.VERTICAL, command=self.technical_text.yview)
             self.technical_text['yscrollcommand'] = tech_scroll.set
             
@@ -801,7 +1359,7 @@ class IPSWComparerGUI:
             impact_frame = ttk.Frame(self.results_notebook)
             self.results_notebook.add(impact_frame, text="Impact Analysis")
             
-            self.impact_text = tk.Text(impact_frame, height=15, wrap=tk.WORD)
+            self.impact_text = tk.Text(impact_frame, height=15, wrap=tk.WORD, undo=False)
             impact_scroll = ttk.Scrollbar(impact_frame, orient=tk.VERTICAL, command=self.impact_text.yview)
             self.impact_text['yscrollcommand'] = impact_scroll.set
             
@@ -833,10 +1391,7 @@ class IPSWComparerGUI:
         self.progress_var.set(0)
         
         # Reset text widgets
-        for widget in [self.summary_text, self.technical_text, self.impact_text]:
-            widget.config(state=tk.NORMAL)
-            widget.delete(1.0, tk.END)
-            widget.config(state=tk.DISABLED)
+        self._clear_results()
         
         # Start analysis in separate thread
         thread = threading.Thread(target=self._run_comparison)
@@ -846,35 +1401,64 @@ class IPSWComparerGUI:
     def _run_comparison(self):
         """Run the comparison process"""
         try:
-            self._setup_temp_directory()
-            self._update_status("Extracting first IPSW file...", 10)
-            
-            # Extract IPSWs
-            self._extract_ipsw(self.ipsw1_path.get(), os.path.join(self.temp_dir, "ipsw1"))
-            self._update_status("Extracting second IPSW file...", 30)
-            self._extract_ipsw(self.ipsw2_path.get(), os.path.join(self.temp_dir, "ipsw2"))
-            
-            # Compare files
-            self._update_status("Analyzing differences...", 50)
-            differences = self._compare_directories()
+            # Only the central directory and build manifest are read here;
+            # remote IPSWs are never downloaded whole, so they are skipped
+            self._update_status("Reading firmware manifests...", 5)
+            ipsw_paths = [path for path in (self.ipsw1_path.get(), self.ipsw2_path.get())
+                          if not _is_remote(path)]
+            self.ipsw_manifests = {path: self._ipsw_meta(path).manifest for path in ipsw_paths}
+            self.ipsw_hashes = {}
+            
+            # Read each central directory once for the whole comparison
+            self._zip1, self._zip1_index = self._open_ipsw(self.ipsw1_path.get())
+            self._zip2, self._zip2_index = self._open_ipsw(self.ipsw2_path.get())
+            
+            if self.deep_compare.get():
+                # The file hashes key the comparison cache. hashlib releases
+                # the GIL while hashing, so the two files are read in parallel
+                self._update_status("Verifying firmware files...", 5)
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    self.ipsw_hashes = dict(zip(ipsw_paths, executor.map(self._ipsw_sha256, ipsw_paths)))
+                
+                # A deep comparison of the same two files is reused from disk
+                cache_path = self._differences_cache_path()
+                differences = self._load_differences(cache_path)
+                if differences is not None:
+                    self._update_status("Using cached comparison...", 50)
+                else:
+                    self._setup_temp_directory()
+                    self._update_status("Extracting IPSW files...", 10)
+                    
+                    # Extraction and comparison overlap: each pair is compared
+                    # as soon as both sides of it are on disk
+                    differences = self._extract_and_compare()
+                    self._store_differences(cache_path, differences)
+            else:
+                # Compare CRC-32 and size from the central directories; no
+                # member is inflated or written to disk
+                self._update_status("Analyzing differences...", 50)
+                differences = self._compare_archives()
             
             # Generate analysis
             self._update_status("Generating detailed analysis...", 70)
             analysis = self._generate_detailed_analysis(differences)
             
+            # The summary and technical tabs are final at this point, so they
+            # start rendering while the AI pass runs
+            self._show_results({key: analysis[key] for key in ('summary', 'technical')})
+            
             # Add AI insights
             self._update_status("Performing AI analysis...", 80)
             ai_insights = self._perform_ai_analysis(differences, analysis)
-            analysis['impact'] += "\n\n" + ai_insights
             
-            # Show results
+            # The impact tab is rendered once, with the insights appended
             self._update_status("Preparing analysis report...", 90)
-            self._show_results(analysis)
+            self._show_results({'impact': analysis['impact'] + "\n\n" + ai_insights})
             
             self._update_status("Analysis complete!", 100)
             
         except Exception as e:
-            logging.error(f"Error in comparison: {str(e)}", exc_info=True)
+            logging.exception(f"Error in comparison: {str(e)}")
             self._handle_error(str(e))
         finally:
             self._cleanup()
@@ -887,39 +1471,211 @@ class IPSWComparerGUI:
             messagebox.showerror("Error", "Please select both IPSW files!")
             return False
             
-        if not os.path.exists(self.ipsw1_path.get()) or not os.path.exists(self.ipsw2_path.get()):
-            messagebox.showerror("Error", "One or both selected files do not exist!")
-            return False
+        for path in (self.ipsw1_path.get(), self.ipsw2_path.get()):
+            if not _is_remote(path) and not os.path.exists(path):
+                messagebox.showerror("Error", "One or both selected files do not exist!")
+                return False
             
         return True
 
     def _setup_temp_directory(self):
         """Set up temporary directory for extraction"""
-        self.temp_dir = tempfile.mkdtemp(prefix="ipsw_analyze_")
+        # TemporaryDirectory also removes the tree if the app exits mid-analysis
+        options = {'ignore_cleanup_errors': True} if sys.version_info >= (3, 10) else {}
+        self._temp_ctx = tempfile.TemporaryDirectory(prefix="ipsw_analyze_", **options)
+        self.temp_dir = self._temp_ctx.name
         logging.info(f"Created temp directory: {self.temp_dir}")
 
-    def _cleanup(self):
-        """Clean up temporary files"""
-        if self.temp_dir and os.path.exists(self.temp_dir):
-            try:
-                shutil.rmtree(self.temp_dir, ignore_errors=True)
-                logging.info("Cleaned up temp directory")
-            except Exception as e:
-                logging.error(f"Error cleaning up temp directory: {str(e)}")
-            self.temp_dir = None
+    def _open_archive(self, ipsw_path):
+        """Open a local or remote IPSW as a ZipFile"""
+        if _is_remote(ipsw_path):
+            return _remote_ipsw_open(ipsw_path)
+        archive = zipfile.ZipFile(ipsw_path, 'r')
+        advise_sequential(archive.fp.fileno())
+        return archive
+
+    def _open_ipsw(self, ipsw_path):
+        """Open an IPSW archive and index its members by name"""
+        try:
+            archive = self._open_archive(ipsw_path)
+            index = {info.filename: info for info in archive.infolist()}
+            logging.info(f"Indexed {len(index)} members in {ipsw_path}")
+            return archive, index
+        except Exception as e:
+            logging.error(f"Error opening IPSW: {str(e)}")
+            raise
+
+    def _close_archives(self):
+        """Close the IPSW archives opened for the current comparison"""
+        for archive in (self._zip1, self._zip2):
+            if archive is not None:
+                archive.close()
+        self._zip1 = self._zip2 = None
+        self._zip1_index = self._zip2_index = {}
+
+    def _member_path(self, extract_dir, filename):
+        """Map an archive member name to a path inside extract_dir"""
+        # Same sanitising as ZipFile.extractall: drop drive letters, absolute
+        # prefixes and '..' components so members cannot escape extract_dir
+        parts = [
+            part for part in os.path.splitdrive(filename.replace('\\', '/'))[1].split('/')
+            if part not in ('', '.', '..')
+        ]
+        return os.path.join(extract_dir, *parts)
+
+    def _extract_member(self, archive, info, extract_dir):
+        """Stream a single archive member to disk"""
+        if info.is_dir():
+            return
+        
+        target = self._member_path(extract_dir, info.filename)
+        if info.file_size == 0:
+            # Nothing to inflate; skip opening the member stream
+            open(target, 'wb').close()
+            return
+        
+        if info.file_size < EXTRACT_BUFFER_SIZE:
+            length = SMALL_EXTRACT_BUFFER_SIZE
+        else:
+            length = EXTRACT_BUFFER_SIZE
+        # Never ZipFile.read() here: kernelcaches and root filesystem DMGs
+        # run to gigabytes and would be loaded into memory whole
+        with archive.open(info) as src, open(target, 'wb') as dst:
+            shutil.copyfileobj(src, dst, length)
 
-    def _extract_ipsw(self, ipsw_path, extract_dir):
-        """Extract IPSW file"""
+    def _unzip_members(self, ipsw_path, members, extract_dir):
+        """Extract members with the unzip binary; False if zipfile has to do it"""
+        # Names are passed as arguments after the archive, so one that looks
+        # like an option would be misread
+        if UNZIP is None or _is_remote(ipsw_path) or any(info.filename.startswith('-') for info in members):
+            return False
+        
+        files = [unzip_pattern(info.filename) for info in members if not info.is_dir()]
+        if not files:
+            return True
+        
+        command = [UNZIP, '-qq', '-o', ipsw_path, *files, '-d', extract_dir]
+        try:
+            result = subprocess.run(command, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                                    stderr=subprocess.PIPE, **_POPEN_KW)
+        except OSError as e:
+            logging.warning(f"Could not run unzip, using zipfile: {e}")
+            return False
+        
+        # Exit status 1 only reports warnings
+        if result.returncode > 1:
+            logging.warning(f"unzip exited with status {result.returncode}, using zipfile: "
+                            f"{result.stderr.decode(errors='replace').strip()}")
+            return False
+        return True
+
+    def _extract_batch(self, ipsw_path, members, extract_dir, on_extracted=None):
+        """Extract a batch of members outside the shared ZipFile handle"""
+        # Inflating in a C process keeps DEFLATE out of this interpreter;
+        # small chunks let finished members reach the comparison early. After
+        # one failure the rest of the batch goes straight to zipfile
+        pending = []
+        for start in range(0, len(members), UNZIP_BATCH_SIZE):
+            chunk = members[start:start + UNZIP_BATCH_SIZE]
+            if pending or not self._unzip_members(ipsw_path, chunk, extract_dir):
+                pending.extend(chunk)
+            elif on_extracted is not None:
+                for info in chunk:
+                    on_extracted(info)
+        if not pending:
+            return
+        
+        # ZipFile handles are not thread-safe, so this worker opens its own
+        with self._open_archive(ipsw_path) as archive:
+            for info in pending:
+                self._extract_member(archive, info, extract_dir)
+                if on_extracted is not None:
+                    on_extracted(info)
+
+    def _extract_ipsw(self, archive, index, extract_dir, on_extracted=None):
+        """Extract IPSW file, reporting each finished member to on_extracted"""
         try:
-            with zipfile.ZipFile(ipsw_path, 'r') as zip_ref:
-                zip_ref.extractall(extract_dir)
+            members = list(index.values())
+            
+            # Create the whole directory tree up front so workers never race
+            # on mkdir or repeat it for every member
+            directories = {extract_dir}
+            for info in members:
+                target = self._member_path(extract_dir, info.filename)
+                directories.add(target if info.is_dir() else os.path.dirname(target))
+            for directory in sorted(directories):
+                os.makedirs(directory, exist_ok=True)
+            large = sum(1 for info in members if info.compress_size >= PARALLEL_MIN_MEMBER_SIZE)
+            
+            if EXTRACT_WORKERS < 2 or large < PARALLEL_MIN_MEMBERS:
+                for info in members:
+                    self._extract_member(archive, info, extract_dir)
+                    if on_extracted is not None:
+                        on_extracted(info)
+            else:
+                # Greedy bin-packing by compressed size keeps the inflate work
+                # even across workers; ZipFile handles are not thread-safe, so
+                # every batch opens its own
+                batches = [[] for _ in range(EXTRACT_WORKERS)]
+                loads = [0] * EXTRACT_WORKERS
+                for info in sorted(members, key=lambda info: info.compress_size, reverse=True):
+                    slot = loads.index(min(loads))
+                    batches[slot].append(info)
+                    loads[slot] += info.compress_size
+                
+                with ThreadPoolExecutor(max_workers=EXTRACT_WORKERS) as executor:
+                    futures = [
+                        executor.submit(self._extract_batch, archive.filename, batch, extract_dir, on_extracted)
+                        for batch in batches if batch
+                    ]
+                    for future in futures:
+                        future.result()
+            
             logging.info(f"Extracted IPSW to {extract_dir}")
         except Exception as e:
             logging.error(f"Error extracting IPSW: {str(e)}")
             raise
 
-    def _compare_directories(self):
-        """Compare extracted IPSW directories"""
+    def _member_table(self, ipsw_path, archive):
+        """Get the member table of an IPSW, from the identity cache when local"""
+        if _is_remote(ipsw_path):
+            return MemberTable(archive.infolist())
+        return self._ipsw_meta(ipsw_path).members
+
+    def _compare_archives(self):
+        """Compare IPSWs by their central directories without extracting them"""
+        differences = {
+            'added': [],
+            'removed': [],
+            'modified': [],
+            'unchanged': []
+        }
+        
+        try:
+            table1 = self._member_table(self.ipsw1_path.get(), self._zip1)
+            table2 = self._member_table(self.ipsw2_path.get(), self._zip2)
+            
+            # Members with equal CRC-32 and size are treated as identical
+            for row, name in enumerate(table1.names):
+                other = table2.index.get(name)
+                if other is None:
+                    differences['removed'].append(name)
+                elif table1.crcs[row] != table2.crcs[other] or table1.sizes[row] != table2.sizes[other]:
+                    differences['modified'].append(name)
+                else:
+                    differences['unchanged'].append(name)
+            
+            differences['added'] = [name for name in table2.names if name not in table1.index]
+            
+            logging.info(f"Found differences: {differences}")
+            return differences
+            
+        except Exception as e:
+            logging.error(f"Error comparing archives: {str(e)}")
+            raise
+
+    def _extract_and_compare(self):
+        """Extract both IPSWs and compare each member pair as soon as it lands"""
         differences = {
             'added': [],
             'removed': [],
@@ -931,38 +1687,117 @@ class IPSWComparerGUI:
             dir1 = os.path.join(self.temp_dir, "ipsw1")
             dir2 = os.path.join(self.temp_dir, "ipsw2")
             
-            for root, _, files in os.walk(dir1):
-                rel_path = os.path.relpath(root, dir1)
-                for file in files:
-                    file1_path = os.path.join(root, file)
-                    file2_path = os.path.join(dir2, rel_path, file)
-                    
-                    if os.path.exists(file2_path):
-                        if self._files_differ(file1_path, file2_path):
-                            differences['modified'].append(os.path.join(rel_path, file))
-                        else:
-                            differences['unchanged'].append(os.path.join(rel_path, file))
+            # The central directories already say which files exist on which
+            # side, so only the shared ones have to wait for extraction
+            files1 = {name: info for name, info in self._zip1_index.items() if not info.is_dir()}
+            files2 = {name: info for name, info in self._zip2_index.items() if not info.is_dir()}
+            
+            # Plain set algebra on the key views; no filesystem lookups
+            common = files1.keys() & files2.keys()
+            removed = files1.keys() - common
+            # A size mismatch is already a difference; those pairs are not read
+            shared = {name for name in common if files1[name].file_size == files2[name].file_size}
+            resized = common - shared
+            
+            half_done = set()
+            results = {}
+            lock = threading.Lock()
+            in_flight = threading.BoundedSemaphore(COMPARE_BATCH_SIZE)
+            compared = 0
+            
+            def compare(name):
+                nonlocal compared
+                try:
+                    # Both sides share the size the central directory recorded
+                    differ = self._files_differ(
+                        self._member_path(dir1, name), self._member_path(dir2, name), files1[name].file_size
+                    )
+                finally:
+                    in_flight.release()
+                with lock:
+                    compared += 1
+                    done = compared
+                if done % COMPARE_BATCH_SIZE == 0:
+                    self._update_status("Extracting and comparing files...", 10 + 40 * done // len(shared))
+                return differ
+            
+            with ThreadPoolExecutor(max_workers=COMPARE_WORKERS) as compare_executor:
+                def extracted(info):
+                    # The second side to finish a shared member queues its pair
+                    name = info.filename
+                    if name not in shared:
+                        return
+                    with lock:
+                        if name not in half_done:
+                            half_done.add(name)
+                            return
+                        half_done.discard(name)
+                    # Extraction waits here while a full batch is still queued
+                    in_flight.acquire()
+                    results[name] = compare_executor.submit(compare, name)
+                
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    futures = [
+                        executor.submit(self._extract_ipsw, self._zip1, self._zip1_index, dir1, extracted),
+                        executor.submit(self._extract_ipsw, self._zip2, self._zip2_index, dir2, extracted)
+                    ]
+                    for future in futures:
+                        future.result()
+                
+                # Collect in central directory order once the last pairs finish
+                for name in files1:
+                    if name in removed:
+                        differences['removed'].append(name)
+                    elif name in resized:
+                        differences['modified'].append(name)
+                    elif results[name].result():
+                        differences['modified'].append(name)
                     else:
-                        differences['removed'].append(os.path.join(rel_path, file))
-            
-            # Check for added files
-            for root, _, files in os.walk(dir2):
-                rel_path = os.path.relpath(root, dir2)
-                for file in files:
-                    if not os.path.exists(os.path.join(dir1, rel_path, file)):
-                        differences['added'].append(os.path.join(rel_path, file))
-                        
+                        differences['unchanged'].append(name)
+            
+            differences['added'] = [name for name in files2 if name not in common]
+            
             logging.info(f"Found differences: {differences}")
             return differences
             
         except Exception as e:
-            logging.error(f"Error comparing directories: {str(e)}")
+            logging.error(f"Error comparing extracted files: {str(e)}")
             raise
     
-    def _files_differ(self, file1, file2):
-        """Compare two files using SHA-256 hash"""
+    def _files_differ(self, file1, file2, size=None):
+        """Compare two files byte for byte, given their common size if known"""
         try:
-            return self._get_file_hash(file1) != self._get_file_hash(file2)
+            if size is None:
+                # Files of different sizes differ; no need to read either
+                size = os.stat(file1).st_size
+                if os.stat(file2).st_size != size:
+                    return True
+            size1 = size
+            
+            # Headers and trailers (IMG4 tags, signatures) usually change with
+            # any rebuild, so a few KiB from each end settle most pairs
+            with open(file1, 'rb') as f1, open(file2, 'rb') as f2:
+                if f1.read(PREFILTER_SIZE) != f2.read(PREFILTER_SIZE):
+                    return True
+                if size1 <= PREFILTER_SIZE:
+                    return False
+                if size1 > 2 * PREFILTER_SIZE:
+                    f1.seek(-PREFILTER_SIZE, os.SEEK_END)
+                    f2.seek(-PREFILTER_SIZE, os.SEEK_END)
+                    if f1.read(PREFILTER_SIZE) != f2.read(PREFILTER_SIZE):
+                        return True
+                
+                # Stream the middle and stop at the first differing block;
+                # unlike hashing both sides, nothing past a mismatch is read
+                # and no digest has to be computed
+                f1.seek(PREFILTER_SIZE)
+                f2.seek(PREFILTER_SIZE)
+                while True:
+                    block = f1.read(EXTRACT_BUFFER_SIZE)
+                    if block != f2.read(EXTRACT_BUFFER_SIZE):
+                        return True
+                    if not block:
+                        return False
         except Exception as e:
             logging.error(f"Error comparing files: {str(e)}")
             raise
@@ -1059,20 +1894,39 @@ class IPSWComparerGUI:
             logging.error(f"Error getting file info: {e}")
             return None
         
-    def _get_file_hash(self, filepath):
-        """Calculate SHA-256 hash of a file"""
-        try:
-            sha256_hash = hashlib.sha256()
-            with open(filepath, "rb") as f:
-                for byte_block in iter(lambda: f.read(4096), b""):
-                    sha256_hash.update(byte_block)
-            return sha256_hash.hexdigest()
-        except Exception as e:
-            logging.error(f"Error calculating file hash: {str(e)}")
-            raise
+    def _ipsw_meta(self, ipsw_path):
+        """Get the cached identity of a local IPSW, recomputing it if the file changed"""
+        st = os.stat(ipsw_path)
+        return _ipsw_meta_cached(ipsw_path, st.st_size, st.st_mtime_ns)
+
+    def _ipsw_sha256(self, ipsw_path):
+        """Get the SHA-256 of a local IPSW, or None if it is remote or missing"""
+        # Hashing reads the whole multi-GB file, so it only happens when a
+        # deep-comparison cache key or a JSON export asks for the digest
+        if _is_remote(ipsw_path) or not os.path.isfile(ipsw_path):
+            return None
+        st = os.stat(ipsw_path)
+        return _ipsw_sha256_cached(ipsw_path, st.st_size, st.st_mtime_ns)
 
-    def _analyze_component(self, filename):
+    def _firmware_version(self, ipsw_path):
+        """Describe the firmware version, preferring the build manifest over the filename"""
+        manifest = self.ipsw_manifests.get(ipsw_path)
+        if manifest and 'ProductVersion' in manifest:
+            build = manifest.get('ProductBuildVersion')
+            return f"{manifest['ProductVersion']} ({build})" if build else manifest['ProductVersion']
+        
+        # Extract versions from filenames (assuming format includes version number)
+        match = VERSION_PATTERN.search(os.path.basename(ipsw_path))
+        return match.group(1) if match else 'Unknown'
+
+    def _analyze_component(self, filename, filename_folded=None):
         """Analyze a component based on its filename"""
+        # Member names recur across firmware versions, so results are kept
+        # between comparisons, up to COMPONENT_CACHE_SIZE entries
+        cached = self._component_cache.get(filename)
+        if cached is not None:
+            return cached
+        
         analysis = {
             'component_type': 'unknown',
             'description': '',
@@ -1080,10 +1934,15 @@ class IPSWComparerGUI:
         }
         
         # Extract component type from filename
-        for component_type in self.component_knowledge.keys():
-            if component_type.lower() in filename.lower():
+        if filename_folded is None:
+            filename_folded = filename.casefold()
+        for component_type, folded_name in self._component_names:
+            if folded_name in filename_folded:
                 analysis['component_type'] = component_type
                 analysis.update(self.component_knowledge[component_type])
+                # Own copy, so the pattern notes below never leak into the
+                # shared knowledge base
+                analysis['impact'] = dict(analysis['impact'])
                 break
         
         # Additional analysis based on filename patterns
@@ -1097,6 +1956,9 @@ class IPSWComparerGUI:
             analysis['description'] = 'System configuration file'
             analysis['impact']['configuration'] = 'Changes to system settings and configurations'
         
+        if len(self._component_cache) >= COMPONENT_CACHE_SIZE:
+            self._component_cache.clear()
+        self._component_cache[filename] = analysis
         return analysis
 
     def _perform_ai_analysis(self, differences, basic_analysis):
@@ -1108,19 +1970,11 @@ class IPSWComparerGUI:
             modified_files = differences['modified']
             total_changes = len(modified_files)
             
-            # Initialize counters for different types of changes
-            change_types = defaultdict(int)
-            
-            # Pattern matching for different types of changes
-            for file in modified_files:
-                file_lower = file.lower()
-                
-                # Check against each pattern type
-                for category, info in self.ai_knowledge_base['system_patterns'].items():
-                    for pattern in info['patterns']:
-                        if re.search(pattern, file_lower):
-                            change_types[category] += 1
-                            break
+            # Fold case once; each category matcher then runs once over all
+            # paths, and a path counts once per category
+            folded = [file.casefold() for file in modified_files]
+            hits = match_categories(folded, self._category_matchers)
+            change_types = Counter({category: len(indices) for category, indices in hits.items()})
             
             # Generate insights
             insights.append("\n=== AI-Enhanced Analysis ===\n")
@@ -1129,12 +1983,13 @@ class IPSWComparerGUI:
             if total_changes > self.ai_knowledge_base['change_patterns']['large_scale']['threshold']:
                 insights.append(self.ai_knowledge_base['change_patterns']['large_scale']['explanation'])
             
-            # Analyze component interactions
-            component_changes = set()
-            for file in modified_files:
-                for component in self.component_knowledge.keys():
-                    if component.lower() in file.lower():
-                        component_changes.add(component)
+            # Analyze component interactions; component names contain no NUL,
+            # so one substring test per name covers every path
+            joined = '\x00'.join(folded)
+            component_changes = {
+                component for component, folded_name in self._component_names
+                if folded_name in joined
+            }
             
             # Check for significant component interactions
             for interaction, details in self.ai_knowledge_base['component_interactions'].items():
@@ -1174,7 +2029,7 @@ class IPSWComparerGUI:
             return "\n".join(insights)
             
         except Exception as e:
-            logging.error(f"Error in AI analysis: {str(e)}", exc_info=True)
+            logging.exception(f"Error in AI analysis: {str(e)}")
             return "AI analysis failed: See technical details for more information."
 
     #about and documentation
@@ -1234,13 +2089,19 @@ class IPSWComparerGUI:
     def _show_about(self):
         """Show about dialog"""
         try:
+            # Built once; closing only hides it
+            if self._reopen_window(self._about_window):
+                return
+            
             about_window = tk.Toplevel(self.root)
             about_window.title("About IPSW Firmware Comparison Tool")
             about_window.geometry("400x500")
+            self._about_window = about_window
             
             # Make window modal
             about_window.transient(self.root)
             about_window.grab_set()
+            about_window.protocol("WM_DELETE_WINDOW", lambda: self._hide_window(about_window))
             
             # Add icon if available
             if hasattr(self, 'logo_about'):
@@ -1294,7 +2155,7 @@ Key Features:
             close_btn = ttk.Button(
                 about_window,
                 text="Close",
-                command=about_window.destroy
+                command=lambda: self._hide_window(about_window)
             )
             close_btn.pack(pady=20)
             
@@ -1302,16 +2163,36 @@ Key Features:
             logging.error(f"Error showing about dialog: {e}")
             raise
 
+    def _reopen_window(self, window):
+        """Show a previously built dialog again; False if it has to be built"""
+        if window is None or not window.winfo_exists():
+            return False
+        window.deiconify()
+        window.lift()
+        window.grab_set()
+        return True
+
+    def _hide_window(self, window):
+        """Hide a cached dialog and release its modal grab"""
+        window.grab_release()
+        window.withdraw()
+
     def _show_documentation(self):
         """Show documentation window"""
         try:
+            # Built once; closing only hides it
+            if self._reopen_window(self._doc_window):
+                return
+            
             doc_window = tk.Toplevel(self.root)
             doc_window.title("Documentation - IPSW Firmware Comparison Tool")
             doc_window.geometry("800x600")
+            self._doc_window = doc_window
             
             # Make window modal
             doc_window.transient(self.root)
             doc_window.grab_set()
+            doc_window.protocol("WM_DELETE_WINDOW", lambda: self._hide_window(doc_window))
             
             # Create notebook for tabbed documentation
             doc_notebook = ttk.Notebook(doc_window)
@@ -1327,15 +2208,7 @@ Key Features:
                 font=('Helvetica', 12, 'bold')
             ).pack(anchor=tk.W)
             
-            steps = [
-                "1. Select two IPSW files using the browse buttons",
-                "2. Click 'Analyze Firmware Files' to begin analysis",
-                "3. Wait for the analysis to complete",
-                "4. Review the results in the different tabs",
-                "5. Export the analysis if needed"
-            ]
-            
-            for step in steps:
+            for step in DOC_STEPS:
                 ttk.Label(
                     getting_started,
                     text=step,
@@ -1352,16 +2225,7 @@ Key Features:
                 font=('Helvetica', 12, 'bold')
             ).pack(anchor=tk.W)
             
-            features_list = [
-                "• Detailed component analysis",
-                "• Security impact assessment",
-                "• Performance change detection",
-                "• AI-enhanced analysis",
-                "• Multiple export formats",
-                "• Comprehensive logging"
-            ]
-            
-            for feature in features_list:
+            for feature in DOC_FEATURES:
                 ttk.Label(
                     features,
                     text=feature,
@@ -1372,7 +2236,7 @@ Key Features:
             close_btn = ttk.Button(
                 doc_window,
                 text="Close",
-                command=doc_window.destroy
+                command=lambda: self._hide_window(doc_window)
             )
             close_btn.pack(pady=10)
             
@@ -1382,9 +2246,13 @@ Key Features:
         
     def _export_analysis(self):
         """Export analysis results to file"""
-        if not hasattr(self, 'summary_text') or not self.summary_text.get(1.0, tk.END).strip():
+        if not self._report.get('summary', '').strip():
             messagebox.showwarning("Warning", "No analysis results to export!")
             return
+        # The impact section only arrives once the AI pass has finished
+        if 'impact' not in self._report:
+            messagebox.showwarning("Warning", "Analysis is still in progress!")
+            return
             
         try:
             filename = filedialog.asksaveasfilename(
@@ -1400,126 +2268,112 @@ Key Features:
             
             if filename:
                 file_ext = os.path.splitext(filename)[1].lower()
+                report = self._report
                 
                 if file_ext == '.json':
-                    self._export_json(filename)
+                    # Read here; the writer thread must not touch Tk variables
+                    ipsw1 = self.ipsw1_path.get()
+                    ipsw2 = self.ipsw2_path.get()
+                    metadata = {
+                        'date': datetime.now().isoformat(),
+                        'ipsw1': ipsw1,
+                        'ipsw2': ipsw2
+                    }
+                    
+                    def export():
+                        # Hashed on the writer thread, and only if the
+                        # comparison did not already need the digests
+                        metadata['sha256'] = {
+                            'ipsw1': self._ipsw_sha256(ipsw1),
+                            'ipsw2': self._ipsw_sha256(ipsw2)
+                        }
+                        self._export_json(filename, report, metadata)
                 elif file_ext == '.html':
-                    self._export_html(filename)
+                    export = functools.partial(self._export_html, filename, report)
                 else:
-                    self._export_text(filename)
-                    
-                messagebox.showinfo("Success", "Analysis report exported successfully!")
+                    export = functools.partial(self._export_text, filename, report)
+                
+                # Large reports take a while to escape and write, so that
+                # happens on a worker; it is not a daemon, so quitting still
+                # lets the file finish
+                self.status_var.set("Exporting analysis...")
+                threading.Thread(target=self._run_export, args=(export,)).start()
                 
         except Exception as e:
-            logging.error(f"Error exporting analysis: {str(e)}", exc_info=True)
+            logging.exception(f"Error exporting analysis: {str(e)}")
             messagebox.showerror("Error", f"Failed to export analysis: {str(e)}")
 
+    def _run_export(self, export):
+        """Write an export and report the outcome back on the Tk thread"""
+        try:
+            export()
+            self.root.after(0, lambda: messagebox.showinfo("Success", "Analysis report exported successfully!"))
+        except Exception as e:
+            logging.exception(f"Error exporting analysis: {str(e)}")
+            message = f"Failed to export analysis: {str(e)}"
+            self.root.after(0, lambda: messagebox.showerror("Error", message))
+        finally:
+            self.root.after(0, lambda: self.status_var.set("Ready"))
+
     def _generate_detailed_analysis(self, differences):
         """Generate detailed analysis with sophisticated insights"""
         summary = []
-        technical = []
-        impact = []
+        # The per-component sections grow with every modified file, so they
+        # are streamed into buffers instead of collected as lists of lines
+        technical = io.StringIO()
+        impact = io.StringIO()
 
-        # Get file paths for analysis
-        first_ipsw = os.path.basename(self.ipsw1_path.get())
-        second_ipsw = os.path.basename(self.ipsw2_path.get())
-        
-        # Extract versions from filenames (assuming format includes version number)
-        version1 = re.search(r'(\d+\.\d+[._]\d+)', first_ipsw)
-        version2 = re.search(r'(\d+\.\d+[._]\d+)', second_ipsw)
-        version_str = f"Version {version1.group(1) if version1 else 'Unknown'} → {version2.group(1) if version2 else 'Unknown'}"
+        version1 = self._firmware_version(self.ipsw1_path.get())
+        version2 = self._firmware_version(self.ipsw2_path.get())
+        version_str = f"Version {version1} → {version2}"
         
         # Summary section
         summary.append("=== IPSW Firmware Update Analysis ===\n")
         summary.append(f"Analysis Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        summary.append(f"Firmware Comparison: {version_str}\n")
+        summary.append(f"Firmware Comparison: {version_str}")
+        for label, path in [("First", self.ipsw1_path.get()), ("Second", self.ipsw2_path.get())]:
+            if self.ipsw_hashes.get(path):
+                summary.append(f"{label} IPSW SHA-256: {self.ipsw_hashes[path]}")
+        summary.append("")
         summary.append("Key Findings:")
         
-        # Initialize change counters
-        change_stats = {
-            'security': 0,
-            'performance': 0,
-            'feature': 0,
-            'boot': 0,
-            'system': 0,
-            'critical': 0
-        }
+        # Classify all paths up front, one matcher pass per category; the
+        # counters and tracked buckets fall straight out of the hit sets
+        modified_files = differences['modified']
+        folded = [file.casefold() for file in modified_files]
+        hits = match_categories(folded, self._component_matchers)
+        change_stats = Counter({category: len(indices) for category, indices in hits.items()})
         
-        # Component classification patterns
-        component_patterns = {
-            'security': [
-                r'.*trustcache.*',
-                r'.*seal.*',
-                r'.*crypto.*',
-                r'.*security.*',
-                r'.*certificate.*',
-                r'.*keychain.*',
-                r'.*auth.*'
-            ],
-            'performance': [
-                r'.*kernel.*',
-                r'.*cache.*',
-                r'.*dyld.*',
-                r'.*perf.*',
-                r'.*memory.*'
-            ],
-            'boot': [
-                r'.*iboot.*',
-                r'.*boot.*',
-                r'.*ibss.*',
-                r'.*ibec.*'
-            ],
-            'system': [
-                r'.*system.*',
-                r'.*framework.*',
-                r'.*daemon.*',
-                r'.*service.*'
-            ],
-            'critical': [
-                r'.*kernelcache.*',
-                r'.*sep.*',
-                r'.*baseband.*'
-            ]
-        }
+        # Track critical, security and system changes in file order
+        critical_components = [modified_files[index] for index in sorted(hits['critical'])]
+        security_components = [modified_files[index] for index in sorted(hits['security'])]
+        system_changes = [modified_files[index] for index in sorted(hits['system'])]
+        
+        # Invert the hit sets into each file's categories, in category order,
+        # so only matched files are visited and nothing is re-tested per file
+        file_categories = {}
+        for category, indices in hits.items():
+            for index in indices:
+                file_categories.setdefault(index, []).append(category)
         
-        # Analyze modified components
-        critical_components = []
-        security_components = []
-        system_changes = []
-        
-        for file in differences['modified']:
-            file_lower = file.lower()
-            component_analyzed = False
-            
-            # Analyze file against patterns
-            for category, patterns in component_patterns.items():
-                for pattern in patterns:
-                    if re.match(pattern, file_lower):
-                        change_stats[category] += 1
-                        component_analyzed = True
-                        
-                        # Track critical changes
-                        if category == 'critical':
-                            critical_components.append(file)
-                        elif category == 'security':
-                            security_components.append(file)
-                        elif category == 'system':
-                            system_changes.append(file)
-                        
-                        # Get component analysis
-                        analysis = self._analyze_component(file)
-                        
-                        # Add to technical details
-                        technical.append(f"\nComponent: {file}")
-                        technical.append(f"Category: {category.upper()}")
-                        if analysis['description']:
-                            technical.append(f"Description: {analysis['description']}")
-                        
-                        # Add impacts
-                        if analysis['impact']:
-                            impact.append(f"\n{file}:")
-                            for impact_type, impact_desc in analysis['impact'].items():
-                                impact.append(f"- {impact_type.title()}: {impact_desc}")
+        for index in sorted(file_categories):
+            file = modified_files[index]
+            
+            # Get component analysis, once per file however many categories
+            # it falls into
+            analysis = self._analyze_component(file, folded[index])
+            
+            for category in file_categories[index]:
+                # Add to technical details
+                technical.write(TECHNICAL_ENTRY.format(file, self._category_labels[category]))
+                if analysis['description']:
+                    technical.write(TECHNICAL_DESCRIPTION.format(analysis['description']))
+                
+                # Add impacts
+                if analysis['impact']:
+                    impact.write(IMPACT_ENTRY.format(file))
+                    for impact_type, impact_desc in analysis['impact'].items():
+                        impact.write(IMPACT_LINE.format(self._impact_titles[impact_type], impact_desc))
         
         # Generate high-level summary based on changes
         if critical_components:
@@ -1555,21 +2409,11 @@ Key Features:
         
         # Generate update priority and recommendations
         summary.append("\nUpdate Analysis:")
-        priority = "HIGH" if change_stats['critical'] > 0 or change_stats['security'] > 2 else \
-                  "MEDIUM" if change_stats['security'] > 0 or change_stats['performance'] > 2 else \
-                  "LOW"
-        summary.append(f"Update Priority: {priority}")
+        summary.append(f"Update Priority: {update_priority(change_stats)}")
         
         # Add recommendations
         summary.append("\nRecommendations:")
-        if change_stats['critical'] > 0:
-            summary.append("✓ Critical system update - install as soon as possible")
-        if change_stats['security'] > 0:
-            summary.append("✓ Contains important security improvements")
-        if change_stats['performance'] > 0:
-            summary.append("✓ Performance improvements included")
-        if change_stats['boot'] > 0:
-            summary.append("✓ Backup device before updating due to boot system changes")
+        summary.extend(text for category, text in RECOMMENDATIONS if change_stats[category] > 0)
         
         # Add compatibility notes
         if system_changes:
@@ -1581,47 +2425,134 @@ Key Features:
         
         return {
             'summary': "\n".join(summary),
-            'technical': "\n".join(technical),
-            'impact': "\n".join(impact)
+            # Drop the line break the first entry opened with
+            'technical': technical.getvalue()[1:],
+            'impact': impact.getvalue()[1:]
         }
         
+    def _fetch_latest_release(self):
+        """Fetch the latest GitHub release, revalidating the cached copy by ETag"""
+        url = f"https://api.github.com/repos/{self.github_repo}/releases/latest"
+        cache_path = os.path.join(get_cache_dir(), 'latest_release.json')
+        
+        cached = None
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached.get('url') != url:
+                cached = None
+        except (OSError, ValueError, AttributeError):
+            cached = None
+        
+        # One small JSON request does not need requests; the stdlib client and
+        # ssl are imported on first use so startup never pays for them
+        import ssl
+        import urllib.error
+        import urllib.request
+        
+        headers = {
+            'Accept': 'application/vnd.github+json',
+            'User-Agent': f"IPSW-Firmware-Analysis-Tool/{self.current_version}"
+        }
+        if cached:
+            headers['If-None-Match'] = cached['etag']
+        request = urllib.request.Request(url, headers=headers)
+        
+        # certifi ships with requests and carries a current CA bundle, which
+        # some Python builds lack; fall back to the system store without it
+        try:
+            import certifi
+            context = ssl.create_default_context(cafile=certifi.where())
+        except ImportError:
+            context = ssl.create_default_context()
+        
+        # Network failures are retried twice with a short backoff
+        for attempt in range(UPDATE_ATTEMPTS):
+            try:
+                with urllib.request.urlopen(request, timeout=5, context=context) as response:
+                    data = json.load(response)
+                    etag = response.headers.get('ETag')
+                break
+            except urllib.error.HTTPError as e:
+                # urlopen raises for every non-2xx status, 304 included. A 304
+                # carries no body and is not counted against the rate limit
+                if e.code == 304 and cached:
+                    logging.info("Latest release unchanged since last check")
+                    return cached['release']
+                raise Exception(f"Failed to check for updates: {e.code}")
+            except OSError:
+                if attempt == UPDATE_ATTEMPTS - 1:
+                    raise
+                time.sleep(0.3 * 2 ** attempt)
+        
+        release = {'tag_name': data['tag_name'], 'html_url': data['html_url']}
+        if etag:
+            try:
+                with open(cache_path, 'w', encoding='utf-8') as f:
+                    json.dump({'url': url, 'etag': etag, 'release': release}, f)
+            except OSError as e:
+                logging.warning(f"Could not cache release info: {e}")
+        return release
+
     def _check_updates(self):
         """Check for software updates"""
+        # The request runs off the Tk thread so a slow network never freezes
+        # the window; a second click while one is in flight is ignored
+        if self._update_thread is not None and self._update_thread.is_alive():
+            return
+        
+        self.status_var.set("Checking for updates...")
+        self._update_thread = threading.Thread(target=self._run_update_check, daemon=True)
+        self._update_thread.start()
+
+    def _run_update_check(self):
+        """Fetch the latest release and hand the outcome back to the Tk thread"""
         try:
-            self.status_var.set("Checking for updates...")
-            response = requests.get(f"https://api.github.com/repos/{self.github_repo}/releases/latest")
-            
-            if response.status_code == 200:
-                latest_version = response.json()['tag_name'].replace('v', '')
-                if latest_version > self.current_version:
-                    if messagebox.askyesno("Update Available", 
-                                         f"Version {latest_version} is available. Would you like to download it?"):
-                        webbrowser.open(response.json()['html_url'])
-                else:
-                    messagebox.showinfo("Up to Date", 
-                                      f"You are running the latest version ({self.current_version})")
+            release = self._fetch_latest_release()
+            self.root.after(0, lambda: self._show_update_result(release))
+        except Exception as e:
+            logging.exception(f"Error checking updates: {str(e)}")
+            message = f"Failed to check for updates: {str(e)}"
+            self.root.after(0, lambda: messagebox.showerror("Error", message))
+        finally:
+            self.root.after(0, lambda: self.status_var.set("Ready"))
+
+    def _show_update_result(self, release):
+        """Tell the user whether a newer release is available"""
+        try:
+            # Compared as integer tuples; as strings 1.0.10 sorts below 1.0.9
+            latest_version = release['tag_name'].lstrip('v')
+            if parse_release(latest_version) > parse_release(self.current_version):
+                if messagebox.askyesno("Update Available", 
+                                     f"Version {latest_version} is available. Would you like to download it?"):
+                    webbrowser.open(release['html_url'])
             else:
-                raise Exception(f"Failed to check for updates: {response.status_code}")
+                messagebox.showinfo("Up to Date", 
+                                  f"You are running the latest version ({self.current_version})")
                 
         except Exception as e:
-            logging.error(f"Error checking updates: {str(e)}", exc_info=True)
+            logging.exception(f"Error checking updates: {str(e)}")
             messagebox.showerror("Error", f"Failed to check for updates: {str(e)}")
-        finally:
-            self.status_var.set("Ready")
 
     def _show_results(self, analysis):
-        """Display analysis results in the UI"""
+        """Display analysis results in the UI, updating only the sections given"""
         try:
+            # The report strings are the source of truth for exports; the
+            # Text widgets only render them. The dict is replaced, never
+            # mutated, since exports read it from the UI thread
+            sections = {key: analysis[key] for key in ('summary', 'technical', 'impact') if key in analysis}
+            self._report = {**self._report, **sections}
+            self._report_html = None
+            
+            widgets = {
+                'summary': self.summary_text,
+                'technical': self.technical_text,
+                'impact': self.impact_text
+            }
+            
             def update_text():
-                for widget, content in [
-                    (self.summary_text, analysis['summary']),
-                    (self.technical_text, analysis['technical']),
-                    (self.impact_text, analysis['impact'])
-                ]:
-                    widget.config(state=tk.NORMAL)
-                    widget.delete(1.0, tk.END)
-                    widget.insert(tk.END, content)
-                    widget.config(state=tk.DISABLED)
+                for key, content in sections.items():
+                    self._set_text(widgets[key], content)
                     
             self.root.after(0, update_text)
             
@@ -1629,6 +2560,41 @@ Key Features:
             logging.error(f"Error showing results: {str(e)}")
             raise
 
+    def _set_text(self, widget, content):
+        """Replace the contents of a read-only Text widget"""
+        # A newer report supersedes one that is still being streamed in
+        pending = self._text_jobs.pop(widget, None)
+        if pending is not None:
+            self.root.after_cancel(pending)
+        
+        widget.config(state=tk.NORMAL)
+        widget.delete(1.0, tk.END)
+        widget.config(state=tk.DISABLED)
+        if content:
+            self._insert_chunk(widget, content, 0)
+
+    def _insert_chunk(self, widget, content, offset):
+        """Append one chunk of a report, scheduling the rest for when Tk is idle"""
+        # The widget is only writable while a chunk goes in, so the user
+        # cannot type into it between chunks. It keeps no undo stack, so
+        # nothing is recorded either
+        end = offset + TEXT_INSERT_CHUNK
+        widget.config(state=tk.NORMAL)
+        widget.insert(tk.END, content[offset:end])
+        widget.config(state=tk.DISABLED)
+        
+        if end < len(content):
+            self._text_jobs[widget] = self.root.after_idle(self._insert_chunk, widget, content, end)
+        else:
+            self._text_jobs.pop(widget, None)
+
+    def _clear_results(self):
+        """Empty the result tabs and the report model behind them"""
+        for widget in [self.summary_text, self.technical_text, self.impact_text]:
+            self._set_text(widget, "")
+        self._report = {}
+        self._report_html = None
+
     def _update_status(self, message, progress):
         """Update status message and progress bar"""
         try:
@@ -1644,6 +2610,7 @@ Key Features:
         self._update_status("Error occurred", 0)
 
 def main():
+    root = None
     try:
         logging.info("Starting application")
         root = tk.Tk()
@@ -1657,7 +2624,7 @@ def main():
                 app._cleanup()
                 root.destroy()
             except Exception as e:
-                logging.error(f"Error during shutdown: {str(e)}", exc_info=True)
+                logging.exception(f"Error during shutdown: {str(e)}")
                 root.destroy()
                 
         root.protocol("WM_DELETE_WINDOW", on_closing)
@@ -1665,10 +2632,20 @@ def main():
         logging.info("Starting main loop")
         root.mainloop()
         
+        # The window is gone; let pending temp removals finish before exit
+        app._join_cleanup()
+        
     except Exception as e:
         logging.critical("Fatal error in main application", exc_info=True)
         try:
-            root = tk.Tk()
+            # A second Tk instance in one process is unsafe on some platforms,
+            # so the dialog reuses the first root unless it never came up
+            try:
+                usable = root is not None and root.winfo_exists()
+            except tk.TclError:
+                usable = False
+            if not usable:
+                root = tk.Tk()
             root.withdraw()
             messagebox.showerror("Fatal Error", 
                                f"Application failed to start\n\nError: {str(e)}\n\n"